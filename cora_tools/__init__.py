@@ -8,97 +8,161 @@ Usage:
     from cora_tools.system import get_system_info
 """
 
-# TTS Handler - Speech synthesis
-from .tts_handler import TTSHandler, TTSManager, speak_async
-
-# Memory - Working memory for context
-from .memory import Memory, get_memory, remember, recall, forget, remember_context, recall_context
-
-# Files - File operations
-from .files import (
-    create_file, read_file, append_file, delete_file,
-    move_file, copy_file, rename_file, get_file_info,
-    list_directory, create_directory, delete_directory,
-    read_json, write_json, search_in_file, get_recent_files
-)
-
-# System - System utilities
-from .system import (
-    get_system_info, launch_app, open_file, open_folder,
-    search_files, get_running_processes, kill_process,
-    get_gpu_info, get_memory_usage, set_volume,
-    notify, clipboard_paste, clipboard_copy,
-    take_screenshot, calculate, run_shell
-)
-
-# Calendar - Events and reminders
-from .calendar import (
-    add_event, get_event, delete_event,
-    get_today_events, get_upcoming, get_events_on_date,
-    remind_me, get_pending_reminders
-)
-
-# Reminders - Reminder management
-from .reminders import ReminderManager, parse_time_string
-
-# Screenshots - Screen capture
-from .screenshots import (
-    desktop as screenshot_desktop,
-    window as screenshot_window,
-    region as screenshot_region,
-    list_windows, quick_screenshot,
-    get_screenshot_dir, set_screenshot_dir
-)
-
-# AI Tools - Ollama integration
-from .ai_tools import (
-    check_ollama, list_models, pull_model,
-    chat as ai_chat, generate_code, explain_code
-)
-
-# Code - Code analysis and execution
-from .code import (
-    CodeAssistant, CodeResult, CodeAnalysis,
-    get_code_assistant, write_code, fix_code,
-    run_code, analyze_code, detect_language
-)
-
-# Image Generation
-from .image_gen import generate_image, show_fullscreen_image, get_recent_images
-
-# Browser Control
-from .browser import BrowserController, browse_sync, search_and_screenshot
-
-# Web Tools
-from .web import (
-    fetch as web_fetch,
-    search as web_search,
-    web_search as web_search_detailed,
-    fetch_url, summarize_url
-)
-
-# Email
-from .email_tool import send_email, read_emails, add_contact, list_contacts, parse_email_command
-
-# Media Control
-from .media import EmbyControl, play as media_play, pause as media_pause, now as media_now
-
-# Windows Control
-from .windows import (
-    list_windows as get_windows,
-    focus_window, minimize_window, maximize_window as maximize_win,
-    close_window, arrange_windows
-)
-
-# Self-Modify - Script creation and execution
-from .self_modify import (
-    create_script, run_script, delete_script,
-    list_scripts, cleanup_scripts, create_and_run,
-    get_script_content
-)
+import importlib
+
+# Public name -> (submodule, attribute). Submodules are imported on first
+# access (PEP 562) so importing cora_tools stays cheap.
+_LAZY = {
+    # TTS Handler - Speech synthesis
+    'TTSHandler': ('tts_handler', 'TTSHandler'),
+    'TTSManager': ('tts_handler', 'TTSManager'),
+    'speak_async': ('tts_handler', 'speak_async'),
+    # Memory - Working memory for context
+    'Memory': ('memory', 'Memory'),
+    'get_memory': ('memory', 'get_memory'),
+    'remember': ('memory', 'remember'),
+    'recall': ('memory', 'recall'),
+    'forget': ('memory', 'forget'),
+    'remember_context': ('memory', 'remember_context'),
+    'recall_context': ('memory', 'recall_context'),
+    # Files - File operations
+    'create_file': ('files', 'create_file'),
+    'read_file': ('files', 'read_file'),
+    'append_file': ('files', 'append_file'),
+    'delete_file': ('files', 'delete_file'),
+    'move_file': ('files', 'move_file'),
+    'copy_file': ('files', 'copy_file'),
+    'rename_file': ('files', 'rename_file'),
+    'get_file_info': ('files', 'get_file_info'),
+    'list_directory': ('files', 'list_directory'),
+    'create_directory': ('files', 'create_directory'),
+    'delete_directory': ('files', 'delete_directory'),
+    'read_json': ('files', 'read_json'),
+    'write_json': ('files', 'write_json'),
+    'search_in_file': ('files', 'search_in_file'),
+    'get_recent_files': ('files', 'get_recent_files'),
+    'flush_appends': ('files', 'flush_appends'),
+    # System - System utilities
+    'get_system_info': ('system', 'get_system_info'),
+    'launch_app': ('system', 'launch_app'),
+    'open_file': ('system', 'open_file'),
+    'open_folder': ('system', 'open_folder'),
+    'search_files': ('system', 'search_files'),
+    'get_running_processes': ('system', 'get_running_processes'),
+    'kill_process': ('system', 'kill_process'),
+    'get_gpu_info': ('system', 'get_gpu_info'),
+    'get_memory_usage': ('system', 'get_memory_usage'),
+    'set_volume': ('system', 'set_volume'),
+    'notify': ('system', 'notify'),
+    'clipboard_paste': ('system', 'clipboard_paste'),
+    'clipboard_copy': ('system', 'clipboard_copy'),
+    'take_screenshot': ('system', 'take_screenshot'),
+    'calculate': ('system', 'calculate'),
+    'run_shell': ('system', 'run_shell'),
+    # Calendar - Events and reminders
+    'add_event': ('calendar', 'add_event'),
+    'get_event': ('calendar', 'get_event'),
+    'delete_event': ('calendar', 'delete_event'),
+    'get_today_events': ('calendar', 'get_today_events'),
+    'get_upcoming': ('calendar', 'get_upcoming'),
+    'get_events_on_date': ('calendar', 'get_events_on_date'),
+    'remind_me': ('calendar', 'remind_me'),
+    'get_pending_reminders': ('calendar', 'get_pending_reminders'),
+    # Reminders - Reminder management
+    'ReminderManager': ('reminders', 'ReminderManager'),
+    'parse_time_string': ('reminders', 'parse_time_string'),
+    # Screenshots - Screen capture
+    'screenshot_desktop': ('screenshots', 'desktop'),
+    'screenshot_window': ('screenshots', 'window'),
+    'screenshot_region': ('screenshots', 'region'),
+    'list_windows': ('screenshots', 'list_windows'),
+    'quick_screenshot': ('screenshots', 'quick_screenshot'),
+    'get_screenshot_dir': ('screenshots', 'get_screenshot_dir'),
+    'set_screenshot_dir': ('screenshots', 'set_screenshot_dir'),
+    # AI Tools - Ollama integration
+    'check_ollama': ('ai_tools', 'check_ollama'),
+    'list_models': ('ai_tools', 'list_models'),
+    'pull_model': ('ai_tools', 'pull_model'),
+    'invalidate_ollama_cache': ('ai_tools', 'invalidate_ollama_cache'),
+    'ai_chat': ('ai_tools', 'chat'),
+    'ai_chat_stream': ('ai_tools', 'chat_stream'),
+    'generate_code': ('ai_tools', 'generate_code'),
+    'explain_code': ('ai_tools', 'explain_code'),
+    'ai_analyze': ('ai_tools', 'analyze'),
+    # Code - Code analysis and execution
+    'CodeAssistant': ('code', 'CodeAssistant'),
+    'CodeResult': ('code', 'CodeResult'),
+    'CodeAnalysis': ('code', 'CodeAnalysis'),
+    'get_code_assistant': ('code', 'get_code_assistant'),
+    'write_code': ('code', 'write_code'),
+    'fix_code': ('code', 'fix_code'),
+    'run_code': ('code', 'run_code'),
+    'analyze_code': ('code', 'analyze_code'),
+    'detect_language': ('code', 'detect_language'),
+    # Image Generation
+    'generate_image': ('image_gen', 'generate_image'),
+    'show_fullscreen_image': ('image_gen', 'show_fullscreen_image'),
+    'get_recent_images': ('image_gen', 'get_recent_images'),
+    # Browser Control
+    'BrowserController': ('browser', 'BrowserController'),
+    'browse_sync': ('browser', 'browse_sync'),
+    'search_and_screenshot': ('browser', 'search_and_screenshot'),
+    # Web Tools
+    'web_fetch': ('web', 'fetch'),
+    'web_search': ('web', 'search'),
+    'web_search_detailed': ('web', 'web_search'),
+    'fetch_url': ('web', 'fetch_url'),
+    'summarize_url': ('web', 'summarize_url'),
+    # Email
+    'send_email': ('email_tool', 'send_email'),
+    'send_emails': ('email_tool', 'send_emails'),
+    'read_emails': ('email_tool', 'read_emails'),
+    'add_contact': ('email_tool', 'add_contact'),
+    'list_contacts': ('email_tool', 'list_contacts'),
+    'parse_email_command': ('email_tool', 'parse_email_command'),
+    # Media Control
+    'EmbyControl': ('media', 'EmbyControl'),
+    'media_play': ('media', 'play'),
+    'media_pause': ('media', 'pause'),
+    'media_now': ('media', 'now'),
+    # Windows Control
+    'get_windows': ('windows', 'list_windows'),
+    'focus_window': ('windows', 'focus_window'),
+    'minimize_window': ('windows', 'minimize_window'),
+    'maximize_win': ('windows', 'maximize_window'),
+    'close_window': ('windows', 'close_window'),
+    'arrange_windows': ('windows', 'arrange_windows'),
+    # Self-Modify - Script creation and execution
+    'create_script': ('self_modify', 'create_script'),
+    'run_script': ('self_modify', 'run_script'),
+    'delete_script': ('self_modify', 'delete_script'),
+    'list_scripts': ('self_modify', 'list_scripts'),
+    'cleanup_scripts': ('self_modify', 'cleanup_scripts'),
+    'create_and_run': ('self_modify', 'create_and_run'),
+    'get_script_content': ('self_modify', 'get_script_content'),
+    # Tasks - Task management
+    'TaskManager': ('tasks', 'TaskManager'),
+    'add_task': ('tasks', 'add_task'),
+    'list_tasks': ('tasks', 'list_tasks'),
+    'complete_task': ('tasks', 'complete_task'),
+    'delete_task': ('tasks', 'delete_task'),
+}
+
+
+def __getattr__(name):
+    """Import the submodule providing name on first access and cache it."""
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{target[0]}', __name__)
+    value = getattr(module, target[1])
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Tasks - Task management
-from .tasks import TaskManager, add_task, list_tasks, complete_task, delete_task
 
 __all__ = [
     # TTS
@@ -111,6 +175,7 @@ __all__ = [
     "move_file", "copy_file", "rename_file", "get_file_info",
     "list_directory", "create_directory", "delete_directory",
     "read_json", "write_json", "search_in_file", "get_recent_files",
+    "flush_appends",
     # System
     "get_system_info", "launch_app", "open_file", "open_folder",
     "search_files", "get_running_processes", "kill_process",
@@ -128,8 +193,8 @@ __all__ = [
     "list_windows", "quick_screenshot",
     "get_screenshot_dir", "set_screenshot_dir",
     # AI Tools
-    "check_ollama", "list_models", "pull_model",
-    "ai_chat", "generate_code", "explain_code",
+    "check_ollama", "list_models", "pull_model", "invalidate_ollama_cache",
+    "ai_chat", "ai_chat_stream", "generate_code", "explain_code", "ai_analyze",
     # Code
     "CodeAssistant", "CodeResult", "CodeAnalysis",
     "get_code_assistant", "write_code", "fix_code",
@@ -142,7 +207,7 @@ __all__ = [
     "web_fetch", "web_search", "web_search_detailed",
     "fetch_url", "summarize_url",
     # Email
-    "send_email", "read_emails", "add_contact", "list_contacts", "parse_email_command",
+    "send_email", "send_emails", "read_emails", "add_contact", "list_contacts", "parse_email_command",
     # Media
     "EmbyControl", "media_play", "media_pause", "media_now",
     # Windows
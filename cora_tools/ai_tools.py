@@ -6,82 +6,241 @@ Per ARCHITECTURE.md: Image gen, code gen, summarization, web search.
 """
 
 import json
-import subprocess
+import re
+import socket
+import time
+import urllib.parse
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# Fast JSON for Ollama payloads; orjson works in bytes directly
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
 
 
 # Ollama API settings
 OLLAMA_URL = "http://localhost:11434"
 
+# Persistent keep-alive session so repeated calls reuse the Ollama socket
+_SESSION = None
+if REQUESTS_AVAILABLE:
+    _SESSION = requests.Session()
+    _SESSION.headers['Content-Type'] = 'application/json'
+
+# Errors meaning Ollama could not be reached at all
+_CONNECTION_ERRORS = (urllib.error.URLError,)
+if REQUESTS_AVAILABLE:
+    _CONNECTION_ERRORS += (requests.ConnectionError,)
+
+
+# Shared worker pool for I/O-bound Ollama calls that can overlap
+_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cora-ai')
+
+# Short-lived results for check_ollama/list_models: {key: (timestamp, value)}
+_CACHE = {}
+_CHECK_TTL = 10  # seconds
+_MODELS_TTL = 60  # seconds
+
+
+def invalidate_ollama_cache():
+    """Drop cached Ollama status and model list (e.g. after pulling a model)."""
+    _CACHE.clear()
+
 
 def check_ollama():
-    """Check if Ollama is running.
+    """Check if Ollama is running (cached for a few seconds).
 
     Returns:
         bool: True if Ollama is accessible
     """
+    now = time.monotonic()
+    cached = _CACHE.get('ok')
+    if cached and now - cached[0] < _CHECK_TTL:
+        return cached[1]
+    result = _check_ollama()
+    _CACHE['ok'] = (now, result)
+    return result
+
+
+def _check_ollama():
+    """Probe Ollama without the cache.
+
+    A TCP connect to the API port is enough to tell whether the server is
+    up and avoids an HTTP round-trip that makes Ollama list its models.
+    """
+    parsed = urllib.parse.urlsplit(OLLAMA_URL)
     try:
-        req = urllib.request.Request(f"{OLLAMA_URL}/api/tags")
-        with urllib.request.urlopen(req, timeout=5) as response:
-            return response.status == 200
-    except Exception:
+        with socket.create_connection((parsed.hostname, parsed.port or 80), timeout=1):
+            return True
+    except OSError:
         return False
 
 
 def list_models():
-    """List available Ollama models.
+    """List available Ollama models (cached for a minute).
 
     Returns:
         list: Model names or empty list if error
     """
+    now = time.monotonic()
+    cached = _CACHE.get('models')
+    if cached and now - cached[0] < _MODELS_TTL:
+        return list(cached[1])
+    models = _list_models()
+    if models:
+        _CACHE['models'] = (now, models)
+    return list(models)
+
+
+def _list_models():
+    """Fetch the model list from Ollama without the cache."""
     try:
-        req = urllib.request.Request(f"{OLLAMA_URL}/api/tags")
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            return [m['name'] for m in data.get('models', [])]
+        if _SESSION is not None:
+            data = _loads(_SESSION.get(f"{OLLAMA_URL}/api/tags", timeout=10).content)
+        else:
+            req = urllib.request.Request(f"{OLLAMA_URL}/api/tags")
+            with urllib.request.urlopen(req, timeout=10) as response:
+                data = _loads(response.read())
+        return [m['name'] for m in data.get('models', [])]
     except Exception as e:
         print(f"[!] Failed to list models: {e}")
         return []
 
 
 def pull_model(model_name, progress_callback=None):
-    """Pull/download an Ollama model.
+    """Pull/download an Ollama model via the streaming /api/pull endpoint.
 
     Args:
         model_name: Name of model to pull (e.g., 'llama3.2')
-        progress_callback: Optional callback for progress updates
+        progress_callback: Optional callback, called with each progress
+            event dict ({'status', 'completed', 'total', ...}) as it arrives
 
     Returns:
         bool: True if pulled successfully
     """
     try:
-        result = subprocess.run(
-            ['ollama', 'pull', model_name],
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
-        )
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        print("[!] Model pull timed out")
+        data = _dumps({'name': model_name, 'stream': True})
+        if _SESSION is not None:
+            # Connect quickly; a pull may go quiet while a layer is verified,
+            # but 10 minutes without a single progress line means it stalled
+            resp = _SESSION.post(f"{OLLAMA_URL}/api/pull", data=data, stream=True, timeout=(5, 600))
+            lines = resp.iter_lines()
+        else:
+            req = urllib.request.Request(
+                f"{OLLAMA_URL}/api/pull",
+                data=data,
+                headers={'Content-Type': 'application/json'}
+            )
+            resp = urllib.request.urlopen(req, timeout=600)  # Per-read bound
+            lines = iter(resp.readline, b'')
+
+        with resp:
+            for line in lines:
+                if not line.strip():
+                    continue
+                event = _loads(line)
+                if progress_callback:
+                    progress_callback(event)
+                if event.get('error'):
+                    print(f"[!] Failed to pull model: {event['error']}")
+                    return False
+                if event.get('status') == 'success':
+                    invalidate_ollama_cache()
+                    return True
+        return False
+    except _CONNECTION_ERRORS:
+        print("[!] Ollama not running. Start with: ollama serve")
         return False
     except Exception as e:
         print(f"[!] Failed to pull model: {e}")
         return False
 
 
-def chat(prompt, model='llama3.2', system_prompt=None, history=None):
-    """Chat with Ollama model.
+# Summaries of history heads: {(model, head text): summary}. Failed
+# summaries are never stored, so the next window retries them.
+_HEAD_SUMMARIES = {}
+_HEAD_SUMMARIES_MAX = 32
+
+
+def _summarize_head(head, window, model):
+    """Summarize older conversation turns, or None if the model failed.
+
+    A head grows one block of window messages at a time; when the previous
+    head's summary is cached, only that summary and the new block are sent.
+    """
+    key = (model, '\n'.join(m['content'] for m in head))
+    summary = _HEAD_SUMMARIES.get(key)
+    if summary is not None:
+        return summary
+
+    start = len(head) - window
+    previous = _HEAD_SUMMARIES.get((model, '\n'.join(m['content'] for m in head[:start])))
+    if previous is not None:
+        text = previous + '\n' + '\n'.join(m['content'] for m in head[start:])
+    else:
+        text = key[1]
+    summary = summarize_text(text, max_sentences=5, model=model)
+    if '[!]' in summary:
+        return None  # Error text (possibly after a partial reply)
+
+    if len(_HEAD_SUMMARIES) >= _HEAD_SUMMARIES_MAX:
+        _HEAD_SUMMARIES.pop(next(iter(_HEAD_SUMMARIES)), None)  # Oldest first
+    _HEAD_SUMMARIES[key] = summary
+    return summary
+
+
+def _trim_history(history, max_turns, model):
+    """Bound history to recent turns plus a summary of everything older.
+
+    The head is cut in blocks of 2*max_turns messages so it only changes
+    every max_turns turns and its summary stays cached in between.
+    """
+    window = 2 * max_turns
+    cut = ((len(history) - window) // window) * window
+    if cut <= 0:
+        return history
+
+    head, tail = history[:cut], history[cut:]
+    summary = _summarize_head(head, window, model)
+    if summary is None:
+        return tail
+    return [{'role': 'system', 'content': f"Prior context: {summary}"}] + tail
+
+
+def _ollama_error(status, body):
+    """Error text from a failed Ollama response ({"error": ...} body if present)."""
+    try:
+        message = _loads(body).get('error')
+    except Exception:
+        message = None
+    return message or f"HTTP {status}"
+
+
+def chat_stream(prompt, model='llama3.2', system_prompt=None, history=None, max_turns=12):
+    """Stream a chat reply from Ollama chunk by chunk.
 
     Args:
         prompt: User message
         model: Model name to use
         system_prompt: Optional system prompt
         history: Optional chat history
+        max_turns: Recent turns sent verbatim; older ones are summarized
 
-    Returns:
-        str: AI response or error message
+    Yields:
+        str: Response text chunks as they arrive, or a single error message
     """
     try:
         messages = []
@@ -92,7 +251,7 @@ def chat(prompt, model='llama3.2', system_prompt=None, history=None):
 
         # Add history
         if history:
-            messages.extend(history)
+            messages.extend(_trim_history(history, max_turns, model))
 
         # Add current prompt
         messages.append({'role': 'user', 'content': prompt})
@@ -100,24 +259,87 @@ def chat(prompt, model='llama3.2', system_prompt=None, history=None):
         payload = {
             'model': model,
             'messages': messages,
-            'stream': False
+            'stream': True
         }
 
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            f"{OLLAMA_URL}/api/chat",
-            data=data,
-            headers={'Content-Type': 'application/json'}
-        )
+        data = _dumps(payload)
+        if _SESSION is not None:
+            resp = _SESSION.post(f"{OLLAMA_URL}/api/chat", data=data, stream=True, timeout=60)
+            if resp.status_code != 200:
+                with resp:
+                    yield f"[!] Chat error: {_ollama_error(resp.status_code, resp.content)}"
+                return
+            lines = resp.iter_lines()
+        else:
+            req = urllib.request.Request(
+                f"{OLLAMA_URL}/api/chat",
+                data=data,
+                headers={'Content-Type': 'application/json'}
+            )
+            resp = urllib.request.urlopen(req, timeout=60)
+            lines = iter(resp.readline, b'')
+
+        with resp:
+            for line in lines:
+                if not line.strip():
+                    continue
+                chunk = _loads(line)
+                if chunk.get('error'):
+                    yield f"[!] Chat error: {chunk['error']}"
+                    break
+                content = chunk.get('message', {}).get('content', '')
+                if content:
+                    yield content
+                if chunk.get('done'):
+                    break
+
+    except urllib.error.HTTPError as e:
+        yield f"[!] Chat error: {_ollama_error(e.code, e.read())}"
+    except _CONNECTION_ERRORS:
+        yield "[!] Ollama not running. Start with: ollama serve"
+    except Exception as e:
+        yield f"[!] Chat error: {e}"
 
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode())
-            return result.get('message', {}).get('content', '')
 
-    except urllib.error.URLError:
-        return "[!] Ollama not running. Start with: ollama serve"
-    except Exception as e:
-        return f"[!] Chat error: {e}"
+def chat(prompt, model='llama3.2', system_prompt=None, history=None, max_turns=12):
+    """Chat with Ollama model.
+
+    Args:
+        prompt: User message
+        model: Model name to use
+        system_prompt: Optional system prompt
+        history: Optional chat history
+        max_turns: Recent turns sent verbatim; older ones are summarized
+
+    Returns:
+        str: AI response or error message
+    """
+    return ''.join(chat_stream(prompt, model=model, system_prompt=system_prompt,
+                               history=history, max_turns=max_turns))
+
+
+# Outermost JSON object/array in a reply that may be wrapped in fences or prose
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.S)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.S)
+
+
+def _extract_json(text, pattern):
+    """Parse JSON from a model reply, tolerating markdown fences and extra prose.
+
+    Args:
+        text: Raw model reply
+        pattern: _JSON_OBJECT_RE or _JSON_ARRAY_RE, selecting the expected shape
+
+    Returns:
+        Parsed dict/list, or None if nothing usable was found
+    """
+    match = pattern.search(text)
+    if match is None:
+        return None
+    try:
+        return _loads(match.group(0))
+    except ValueError:
+        return None
 
 
 def generate_code(description, language='python', model='llama3.2'):
@@ -197,15 +419,14 @@ Format: {"sentiment": "positive/negative/neutral", "confidence": 0.0-1.0, "emoti
     prompt = f"Analyze the sentiment of this text:\n\n{text}"
     response = chat(prompt, model=model, system_prompt=system_prompt)
 
-    try:
-        # Try to parse as JSON
-        return json.loads(response)
-    except json.JSONDecodeError:
-        return {
-            'sentiment': 'unknown',
-            'confidence': 0.0,
-            'raw_response': response
-        }
+    parsed = _extract_json(response, _JSON_OBJECT_RE)
+    if parsed is not None:
+        return parsed
+    return {
+        'sentiment': 'unknown',
+        'confidence': 0.0,
+        'raw_response': response
+    }
 
 
 def translate_text(text, target_language, model='llama3.2'):
@@ -248,14 +469,43 @@ Return JSON only: {"priority": 1-10, "reasoning": "brief explanation"}"""
 
     response = chat(prompt, model=model, system_prompt=system_prompt)
 
-    try:
-        return json.loads(response)
-    except json.JSONDecodeError:
-        return {
-            'priority': 5,
-            'reasoning': 'Could not analyze',
-            'raw_response': response
-        }
+    parsed = _extract_json(response, _JSON_OBJECT_RE)
+    if parsed is not None:
+        return parsed
+    return {
+        'priority': 5,
+        'reasoning': 'Could not analyze',
+        'raw_response': response
+    }
+
+
+# Formatted static part of the personality prompt: {canonical JSON of the
+# personality: prefix}. Keyed by content, so a freshly loaded copy hits and
+# an edited dict misses.
+_PERS_CACHE = {}
+_PERS_CACHE_MAX = 8
+
+
+def _pers_prefix(personality):
+    """Return the cached personality section of the system prompt."""
+    key = json.dumps(personality, sort_keys=True, default=str)
+    cached = _PERS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    style = personality.get('personality', {})
+    prefix = f"""You are {personality.get('name', 'CORA')}.
+Identity: {personality.get('identity', 'personal assistant')}
+Tone: {style.get('tone', 'helpful')}
+Style: {style.get('style', 'professional')}
+
+NEVER say: {', '.join(personality.get('never_say', []))}
+
+"""
+    if len(_PERS_CACHE) >= _PERS_CACHE_MAX:
+        _PERS_CACHE.pop(next(iter(_PERS_CACHE)), None)  # Oldest first
+    _PERS_CACHE[key] = prefix
+    return prefix
 
 
 def generate_response(context, personality, user_input, model='llama3.2'):
@@ -263,22 +513,16 @@ def generate_response(context, personality, user_input, model='llama3.2'):
 
     Args:
         context: Current system context (tasks, state)
-        personality: Personality settings dict
+        personality: Personality settings dict (the formatted prompt is
+            cached per distinct content)
         user_input: User's message
         model: Model to use
 
     Returns:
         str: Generated response
     """
-    # Build system prompt from personality
-    system_prompt = f"""You are {personality.get('name', 'CORA')}.
-Identity: {personality.get('identity', 'personal assistant')}
-Tone: {personality.get('personality', {}).get('tone', 'helpful')}
-Style: {personality.get('personality', {}).get('style', 'professional')}
-
-NEVER say: {', '.join(personality.get('never_say', []))}
-
-Current context: {context}
+    # Build system prompt from cached personality prefix + volatile context
+    system_prompt = _pers_prefix(personality) + f"""Current context: {context}
 
 Respond naturally in character. Keep responses concise (under 30 words unless explaining something complex)."""
 
@@ -303,12 +547,13 @@ Return as JSON array only: ["keyword1", "keyword2", ...]"""
     prompt = f"Extract keywords from:\n\n{text}"
     response = chat(prompt, model=model, system_prompt=system_prompt)
 
-    try:
-        return json.loads(response)
-    except json.JSONDecodeError:
-        # Try to extract from raw response
-        words = [w.strip() for w in response.replace('[', '').replace(']', '').replace('"', '').split(',')]
-        return words[:max_keywords]
+    parsed = _extract_json(response, _JSON_ARRAY_RE)
+    if parsed is not None:
+        return parsed
+
+    # Try to extract from raw response
+    words = [w.strip() for w in response.replace('[', '').replace(']', '').replace('"', '').split(',')]
+    return words[:max_keywords]
 
 
 def ask_question(question, context=None, model='llama3.2'):
@@ -331,3 +576,24 @@ If you don't know something, say so."""
         prompt = f"Context: {context}\n\nQuestion: {question}"
 
     return chat(prompt, model=model, system_prompt=system_prompt)
+
+
+def analyze(text, model='llama3.2'):
+    """Run sentiment, keyword and summary analysis on the same text concurrently.
+
+    Each sub-call waits on Ollama, so they overlap in the shared pool and the
+    total time is roughly that of the slowest one.
+
+    Args:
+        text: Text to analyze
+        model: Model to use
+
+    Returns:
+        dict: {'sentiment': dict, 'keywords': list, 'summary': str}
+    """
+    futures = {
+        'sentiment': _POOL.submit(analyze_sentiment, text, model=model),
+        'keywords': _POOL.submit(extract_keywords, text, model=model),
+        'summary': _POOL.submit(summarize_text, text, model=model),
+    }
+    return {key: future.result() for key, future in futures.items()}
@@ -13,25 +13,43 @@ Created by: Unity AI Lab
 Date: 2025-12-23
 """
 
+import asyncio
+import hashlib
+import json
+import queue
+import sqlite3
 import subprocess
+import threading
+import time
 import tempfile
 import os
 import sys
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Iterator, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+# Fast JSON validation for detect_language
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Try to import AI modules
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from ai.ollama import chat, think
+    from ai.ollama import chat, think, async_chat, chat_stream, async_chat_stream
     HAS_OLLAMA = True
 except ImportError:
     HAS_OLLAMA = False
     chat = None
     think = None
+    async_chat = None
+    chat_stream = None
+    async_chat_stream = None
 
 
 class Language(Enum):
@@ -47,6 +65,104 @@ class Language(Enum):
     UNKNOWN = "unknown"
 
 
+# Precompiled patterns (built once at import)
+_DANGEROUS_PATTERNS = [
+    r'\brm\s+-rf\b',
+    r'\bformat\s+[a-z]:\b',
+    r'\bdel\s+/[sf]\b',
+    r'os\.remove|os\.unlink|shutil\.rmtree',
+    r'subprocess\.call.*shell\s*=\s*True',
+    r'\beval\s*\(',
+    r'\bexec\s*\(',
+    r'__import__',
+    r'open\s*\([^)]*["\']w["\']',
+    r'DROP\s+TABLE|DELETE\s+FROM|TRUNCATE',
+]
+# One alternation so a safety check is a single scan of the code
+_DANGEROUS_RE = re.compile('|'.join(f'(?:{p})' for p in _DANGEROUS_PATTERNS), re.IGNORECASE)
+
+# Python constructs counted by _static_explain in one scan
+_PY_CONSTRUCTS_RE = re.compile(
+    r'(?P<def>\bdef \w+)|(?P<class>\bclass \w+)|(?P<imp>^(?:import|from)\s+)',
+    re.MULTILINE
+)
+_JS_FUNC_RE = re.compile(r'\bfunction\s+\w+|\b\w+\s*=\s*(?:async\s*)?\(')
+
+_SECTION_RES = {
+    'SUMMARY': re.compile(r'SUMMARY:\s*(.+?)(?=EXPLANATION:|ISSUES:|$)', re.DOTALL),
+    'EXPLANATION': re.compile(r'EXPLANATION:\s*(.+?)(?=ISSUES:|SUGGESTIONS:|$)', re.DOTALL),
+    'ISSUES': re.compile(r'ISSUES:\s*(.+?)(?=SUGGESTIONS:|$)', re.DOTALL),
+    'SUGGESTIONS': re.compile(r'SUGGESTIONS:\s*(.+?)$', re.DOTALL),
+}
+
+# Language indicators for detect_language, one alternation group per
+# language so a single finditer() pass finds them all
+def _token_group(name: str, tokens: List[str]) -> str:
+    return f"(?P<{name}>{'|'.join(re.escape(t) for t in tokens)})"
+
+
+_LANG_ORDER = [
+    Language.PYTHON.value,
+    Language.JAVASCRIPT.value,
+    Language.BASH.value,
+    Language.POWERSHELL.value,
+]
+_LANG_RANK = {lang: i for i, lang in enumerate(_LANG_ORDER)}
+_LANG_TOKENS_RE = re.compile('|'.join([
+    _token_group('python', ['def ', 'import ', 'from ', 'class ', 'print(', 'if __name__']),
+    _token_group('javascript', ['function ', 'const ', 'let ', 'var ', '=>', 'console.log',
+                                'document.', 'window.']),
+    _token_group('bash', ['echo ', '| grep', 'if [', 'for i in']),
+    _token_group('powershell', ['$PSVersionTable', 'Write-Host', 'Get-', 'Set-', '-eq', '-ne']),
+]))
+_LANG_TOKENS_CI_RE = re.compile('|'.join([
+    _token_group('html', ['<html', '<!doctype', '<div']),
+    _token_group('css', ['color:', 'margin:', 'padding:', 'display:', 'font-']),
+    _token_group('sql', ['select ', 'insert ', 'update ', 'delete ', 'create table']),
+]))
+
+# Fenced code block patterns per language, most specific first
+_CODE_BLOCK_RES: Dict[str, List["re.Pattern"]] = {}
+
+
+def _code_block_res(language: str) -> List["re.Pattern"]:
+    """Return the compiled code-block patterns for a language (compiled on first use)."""
+    patterns = _CODE_BLOCK_RES.get(language)
+    if patterns is None:
+        lang = re.escape(language)
+        patterns = [
+            re.compile(rf'```{lang}\n(.*?)```', re.DOTALL | re.IGNORECASE),
+            re.compile(r'```\n(.*?)```', re.DOTALL | re.IGNORECASE),
+            re.compile(rf'```{lang}(.*?)```', re.DOTALL | re.IGNORECASE),
+        ]
+        _CODE_BLOCK_RES[language] = patterns
+    return patterns
+
+
+for _lang in Language:
+    _code_block_res(_lang.value)
+
+
+@lru_cache(maxsize=256)
+def _extract_code_block(response: str, language: str) -> str:
+    """Body of CodeAssistant._extract_code, memoized per (response, language)."""
+    if '```' not in response:
+        # No code block found, return as-is (might be plain code)
+        return response.strip()
+
+    # Try to find code block
+    for pattern in _code_block_res(language):
+        match = pattern.search(response)
+        if match:
+            return match.group(1).strip()
+
+    # Bare code closed by a fence (the prompt opened the block)
+    if not response.lstrip().startswith('```'):
+        return response[:response.index('```')].strip()
+
+    return response.strip()
+
+
 @dataclass
 class CodeResult:
     """Result of code execution."""
@@ -67,6 +183,328 @@ class CodeAnalysis:
     suggestions: List[str]
 
 
+# Prompt templates. The fixed instructions come first and the variable
+# code/description last, so consecutive requests of the same kind share a
+# long token prefix and Ollama can reuse its KV cache for it (the server
+# keeps one cache per slot; OLLAMA_NUM_PARALLEL sets the slot count).
+_PROMPT_HEADS = {
+    'explain_brief': "Briefly explain this {lang} code in 1-2 sentences:\n\n```{lang}\n",
+    'explain_medium': """Explain this {lang} code. Describe what it does, its main components, and how they work together.
+
+```{lang}
+""",
+    'explain_detailed': """Provide a detailed explanation of this {lang} code.
+
+Include:
+1. Overall purpose
+2. Line-by-line breakdown
+3. Key functions/methods used
+4. Input/output behavior
+5. Potential edge cases
+
+```{lang}
+""",
+    'fix': """Review and fix any issues in this {lang} code. Fix any bugs, syntax errors, or logic issues. Provide only the corrected code.
+
+```{lang}
+""",
+    'fix_error': """Fix this {lang} code so that the error below no longer occurs. Provide only the corrected code.
+
+Code:
+```{lang}
+""",
+    'analyze': """Analyze this {lang} code.
+
+Provide:
+1. Brief summary (one sentence)
+2. Detailed explanation
+3. List of issues/bugs found
+4. List of improvement suggestions
+
+Format as:
+SUMMARY: ...
+EXPLANATION: ...
+ISSUES:
+- issue 1
+- issue 2
+SUGGESTIONS:
+- suggestion 1
+- suggestion 2
+
+```{lang}
+""",
+    'write': """Write {lang} code.
+
+Requirements:
+- Clean, readable code
+- Follow {lang} best practices
+- {comments}
+- Only output the code, no explanations
+
+Task:
+""",
+}
+
+
+@lru_cache(maxsize=128)
+def _prompt_head(kind: str, language: str, comments: str = '') -> str:
+    """Format a prompt head once per (kind, language)."""
+    return _PROMPT_HEADS[kind].format(lang=language, comments=comments)
+
+
+def _code_block_end(text: str) -> Optional[int]:
+    """Return where the first code block in a partial reply ends, or None.
+
+    Only complete lines are judged. The first fence opens a block and only
+    the next one closes it, so prose before a bare fence is never taken for
+    the answer. Bare code closed by a fence (the write_code prompt opens the
+    block) therefore streams to the end; _extract_code_block still finds it.
+    """
+    opened = False
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        if not line.endswith('\n'):
+            break
+        if line.strip().startswith('```'):
+            if opened:
+                return pos + len(line)
+            opened = True
+        pos += len(line)
+    return None
+
+
+@lru_cache(maxsize=512)
+def _detect_language(code: str) -> str:
+    """Language detection behind CodeAssistant.detect_language.
+
+    Memoized so a snippet passed through explain -> fix -> run is scanned once.
+    """
+    code_lower = code.lower().strip()
+
+    # One scan for all case-sensitive indicators, keeping the old
+    # precedence: python > javascript > bash > powershell
+    best = None
+    for match in _LANG_TOKENS_RE.finditer(code):
+        rank = _LANG_RANK[match.lastgroup]
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+
+    if code.startswith('#!') and 'python' in code_lower[:50]:
+        best = 0
+    elif code.startswith('#!/bin/bash') or code.startswith('#!/bin/sh'):
+        if best is None or best > 2:
+            best = 2
+    if best is not None:
+        return _LANG_ORDER[best]
+
+    # One scan of the lowercased text for html/css/sql indicators
+    found = {match.lastgroup for match in _LANG_TOKENS_CI_RE.finditer(code_lower)}
+
+    # HTML indicators
+    if 'html' in found:
+        return Language.HTML.value
+
+    # CSS indicators
+    if 'css' in found and '{' in code and (':' in code) and (';' in code):
+        return Language.CSS.value
+
+    # JSON indicators (cheap brace check before a full parse)
+    stripped = code.strip()
+    if stripped[:1] == '{' and stripped[-1:] == '}':
+        try:
+            _json_loads(stripped)
+            return Language.JSON.value
+        except Exception:
+            pass
+
+    # SQL indicators
+    if 'sql' in found:
+        return Language.SQL.value
+
+    return Language.UNKNOWN.value
+
+
+class _PromptCache:
+    """Exact-match cache of model replies, persisted in SQLite.
+
+    Keyed by SHA-256 of (model, prompt); the least recently used entries are
+    evicted beyond max_entries.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v TEXT, ts REAL)")
+        self._db.commit()
+
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT v FROM cache WHERE k = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE cache SET ts = ? WHERE k = ?", (time.time(), key))
+            self._db.commit()
+            return row[0]
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO cache (k, v, ts) VALUES (?, ?, ?)",
+                             (key, value, time.time()))
+            self._db.execute(
+                "DELETE FROM cache WHERE k NOT IN (SELECT k FROM cache ORDER BY ts DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self._db.commit()
+
+
+# Child side of _PyWorker: forks a fresh child per snippet, so nothing a
+# snippet does (cwd, sys.modules, monkeypatched modules) outlives it. The
+# child's fd 1 and fd 2 point at temp files (so os.system, child processes
+# and C extensions are captured too); the worker answers with one marked JSON
+# line per request on a private copy of the original stdout
+_PY_WORKER_SOURCE = r"""
+import json, os, select, signal, sys, tempfile, types
+MARK = %r
+requests = os.fdopen(os.dup(0), 'r', encoding='utf-8')
+proto = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+devnull = os.open(os.devnull, os.O_RDONLY)
+os.dup2(devnull, 0)  # snippets can't read the request stream
+os.close(devnull)
+snippet = None
+for line in requests:
+    req = json.loads(line)
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        done_r, done_w = os.pipe()  # EOF on done_r once the child is gone
+        pid = os.fork()
+        if pid == 0:
+            os.close(done_r)
+            os.dup2(out.fileno(), 1)
+            os.dup2(err.fileno(), 2)
+            requests.close()
+            proto.close()
+            snippet = req['code']
+            break
+        os.close(done_w)
+        timed_out = not select.select([done_r], [], [], req['timeout'])[0]
+        if timed_out:
+            os.kill(pid, signal.SIGKILL)
+        os.close(done_r)
+        status = os.waitpid(pid, 0)[1]
+        rc = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+        out.seek(0)
+        err.seek(0)
+        result = {'stdout': out.read().decode('utf-8', 'replace'),
+                  'stderr': err.read().decode('utf-8', 'replace'),
+                  'rc': rc, 'timed_out': timed_out}
+    proto.write(MARK + json.dumps(result) + '\n')
+    proto.flush()
+
+if snippet is not None:
+    # Forked child: run the snippet as a script read from stdin would be run
+    main = types.ModuleType('__main__')
+    main.__file__ = '<stdin>'
+    sys.modules['__main__'] = main
+    try:
+        exec(compile(snippet, '<stdin>', 'exec'), main.__dict__)
+    except SystemExit:
+        raise
+    except BaseException as e:
+        import traceback
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)  # Skip this frame
+        sys.exit(1)
+"""
+
+
+class _WorkerCrashed(RuntimeError):
+    """The worker died after receiving a snippet (which must not be re-run)."""
+
+
+class _PyWorker:
+    """Long-lived Python interpreter that forks a child for each snippet.
+
+    Saves the interpreter start-up cost of a fresh subprocess per run while
+    keeping runs isolated from each other. Needs os.fork, so it is only used
+    on POSIX; a snippet that times out is killed by the worker, which stays up.
+    """
+
+    MARK = '\x00CORA-RESULT\x00'
+    GRACE = 10  # Seconds past the snippet timeout before the worker itself is presumed hung
+
+    def __init__(self, cwd: Path):
+        self.cwd = cwd
+        self.proc = None
+        self._results = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, '-u', '-c', _PY_WORKER_SOURCE % self.MARK],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            cwd=str(self.cwd),
+            env=dict(os.environ, PYTHONIOENCODING='utf-8')
+        )
+        self._results = queue.Queue()
+        threading.Thread(target=self._read, args=(self.proc, self._results), daemon=True).start()
+
+    def _read(self, proc, results):
+        """Forward marked result lines; stray writes to fd 1 are dropped."""
+        for line in proc.stdout:
+            if line.startswith(self.MARK):
+                results.put(json.loads(line[len(self.MARK):]))
+        results.put(None)  # Worker exited
+
+    def stop(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc = None
+
+    def _ensure_started(self):
+        if self.proc is None or self.proc.poll() is not None:
+            self._start()
+
+    def warm(self):
+        """Start the worker if needed without waiting for it to boot."""
+        with self._lock:
+            self._ensure_started()
+
+    def run(self, code: str, timeout: int) -> Tuple[str, str, int]:
+        """Run a snippet; returns (stdout, stderr, return_code).
+
+        Raises:
+            subprocess.TimeoutExpired: If the snippet exceeds timeout
+            _WorkerCrashed: If the worker died while running the snippet
+            OSError: If the snippet could not be handed to a worker at all
+        """
+        with self._lock:
+            self._ensure_started()
+            self.proc.stdin.write(json.dumps({'code': code, 'timeout': timeout}) + '\n')
+            self.proc.stdin.flush()
+            # The snippet may be running from here on; nothing below may raise OSError
+            try:
+                result = self._results.get(timeout=timeout + self.GRACE)
+            except queue.Empty:
+                self.stop()
+                raise subprocess.TimeoutExpired('python', timeout)
+            if result is None:
+                return_code = self.proc.wait()
+                self.proc = None
+                raise _WorkerCrashed(f"Python process exited unexpectedly (exit code {return_code})")
+            if result['timed_out']:
+                raise subprocess.TimeoutExpired('python', timeout)
+            return result['stdout'], result['stderr'], result['rc']
+
+
 class CodeAssistant:
     """
     AI-powered code assistance.
@@ -89,6 +527,9 @@ class CodeAssistant:
         self.timeout = timeout
         self._temp_dir = Path(tempfile.gettempdir()) / "cora_code"
         self._temp_dir.mkdir(exist_ok=True)
+        self._cache = _PromptCache(self._temp_dir / "cache.sqlite")
+        # Forking workers only exist on POSIX; elsewhere every run gets a fresh process
+        self._py_worker = _PyWorker(self._temp_dir) if hasattr(os, 'fork') else None
 
     def detect_language(self, code: str) -> str:
         """Detect programming language from code.
@@ -99,113 +540,181 @@ class CodeAssistant:
         Returns:
             Language name string
         """
-        code_lower = code.lower().strip()
-
-        # Python indicators
-        if any(x in code for x in ['def ', 'import ', 'from ', 'class ', 'print(', 'if __name__']):
-            return Language.PYTHON.value
-        if code.startswith('#!') and 'python' in code_lower[:50]:
-            return Language.PYTHON.value
-
-        # JavaScript indicators
-        if any(x in code for x in ['function ', 'const ', 'let ', 'var ', '=>', 'console.log']):
-            return Language.JAVASCRIPT.value
-        if 'document.' in code or 'window.' in code:
-            return Language.JAVASCRIPT.value
-
-        # Bash indicators
-        if code.startswith('#!/bin/bash') or code.startswith('#!/bin/sh'):
-            return Language.BASH.value
-        if any(x in code for x in ['echo ', '| grep', 'if [', 'for i in']):
-            return Language.BASH.value
-
-        # PowerShell indicators
-        if any(x in code for x in ['$PSVersionTable', 'Write-Host', 'Get-', 'Set-', '-eq', '-ne']):
-            return Language.POWERSHELL.value
-
-        # HTML indicators
-        if '<html' in code_lower or '<!doctype' in code_lower or '<div' in code_lower:
-            return Language.HTML.value
-
-        # CSS indicators
-        if '{' in code and (':' in code) and (';' in code):
-            if any(x in code_lower for x in ['color:', 'margin:', 'padding:', 'display:', 'font-']):
-                return Language.CSS.value
-
-        # JSON indicators
-        if code.strip().startswith('{') and code.strip().endswith('}'):
-            try:
-                import json
-                json.loads(code)
-                return Language.JSON.value
-            except Exception:
-                pass
-
-        # SQL indicators
-        if any(x in code_lower for x in ['select ', 'insert ', 'update ', 'delete ', 'create table']):
-            return Language.SQL.value
+        return _detect_language(code)
 
-        return Language.UNKNOWN.value
+    def _chat(self, prompt: str, use_cache: bool = False) -> str:
+        """Send a single-turn prompt to the code model and return the reply text.
 
-    def explain_code(self, code: str, detail_level: str = "medium") -> str:
+        With use_cache, identical (model, prompt) pairs are answered from the
+        persistent prompt cache; errors are never cached.
+        """
+        key = self._cache.key(self.model, prompt) if use_cache else None
+        if key:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = chat([{'role': 'user', 'content': prompt}], model=self.model, timeout=self.timeout)
+        if response.error:
+            raise RuntimeError(response.error)
+        if key:
+            self._cache.put(key, response.content)
+        return response.content
+
+    async def _achat(self, prompt: str, use_cache: bool = False) -> str:
+        """Async version of _chat() for concurrent requests."""
+        key = self._cache.key(self.model, prompt) if use_cache else None
+        if key:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await async_chat([{'role': 'user', 'content': prompt}], model=self.model, timeout=self.timeout)
+        if response.error:
+            raise RuntimeError(response.error)
+        if key:
+            self._cache.put(key, response.content)
+        return response.content
+
+    def _chat_stream(self, prompt: str, use_cache: bool = False) -> Iterator[str]:
+        """Streaming version of _chat(); yields reply chunks as they arrive.
+
+        Only a reply that streamed to completion without an error chunk is
+        cached, so a consumer that stops early never leaves a truncated
+        entry behind.
+        """
+        key = self._cache.key(self.model, prompt) if use_cache else None
+        if key:
+            cached = self._cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        failed = False
+        for chunk in chat_stream([{'role': 'user', 'content': prompt}], model=self.model, timeout=self.timeout):
+            if chunk.startswith('[Error'):
+                if not parts:
+                    raise RuntimeError(chunk.strip('[]'))
+                failed = True  # Mid-stream error: show it, but don't cache it
+            parts.append(chunk)
+            yield chunk
+        if key and not failed:
+            self._cache.put(key, ''.join(parts))
+
+    async def _achat_stream(self, prompt: str, use_cache: bool = False) -> AsyncIterator[str]:
+        """Async version of _chat_stream()."""
+        key = self._cache.key(self.model, prompt) if use_cache else None
+        if key:
+            cached = self._cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        failed = False
+        async for chunk in async_chat_stream([{'role': 'user', 'content': prompt}], model=self.model, timeout=self.timeout):
+            if chunk.startswith('[Error'):
+                if not parts:
+                    raise RuntimeError(chunk.strip('[]'))
+                failed = True  # Mid-stream error: show it, but don't cache it
+            parts.append(chunk)
+            yield chunk
+        if key and not failed:
+            self._cache.put(key, ''.join(parts))
+
+    def explain_code(self, code: str, detail_level: str = "medium", use_cache: bool = True) -> str:
         """Explain what code does.
 
         Args:
             code: Source code to explain
             detail_level: "brief", "medium", or "detailed"
+            use_cache: Reuse the reply for an identical earlier request
 
         Returns:
             Explanation string
         """
         language = self.detect_language(code)
+        prompt = self._explain_prompt(code, language, detail_level)
 
-        # Build explanation prompt
-        if detail_level == "brief":
-            prompt = f"Briefly explain this {language} code in 1-2 sentences:\n\n```{language}\n{code}\n```"
-        elif detail_level == "detailed":
-            prompt = f"""Provide a detailed explanation of this {language} code:
+        if HAS_OLLAMA and chat:
+            try:
+                return self._chat(prompt, use_cache=use_cache)
+            except Exception as e:
+                return f"AI explanation unavailable: {e}\n\nLanguage detected: {language}"
+        else:
+            # Fallback: basic static analysis
+            return self._static_explain(code, language)
 
-```{language}
-{code}
-```
+    async def aexplain_code(self, code: str, detail_level: str = "medium", use_cache: bool = True) -> str:
+        """Async version of explain_code()."""
+        language = self.detect_language(code)
+        prompt = self._explain_prompt(code, language, detail_level)
 
-Include:
-1. Overall purpose
-2. Line-by-line breakdown
-3. Key functions/methods used
-4. Input/output behavior
-5. Potential edge cases"""
-        else:  # medium
-            prompt = f"""Explain this {language} code:
+        if HAS_OLLAMA and async_chat:
+            try:
+                return await self._achat(prompt, use_cache=use_cache)
+            except Exception as e:
+                return f"AI explanation unavailable: {e}\n\nLanguage detected: {language}"
+        return self._static_explain(code, language)
 
-```{language}
-{code}
-```
+    def explain_code_stream(self, code: str, detail_level: str = "medium", use_cache: bool = True) -> Iterator[str]:
+        """Streaming version of explain_code(); yields text as the model writes it."""
+        language = self.detect_language(code)
+        prompt = self._explain_prompt(code, language, detail_level)
 
-Describe what it does, its main components, and how they work together."""
+        if HAS_OLLAMA and chat_stream:
+            try:
+                yield from self._chat_stream(prompt, use_cache=use_cache)
+            except Exception as e:
+                yield f"AI explanation unavailable: {e}\n\nLanguage detected: {language}"
+        else:
+            yield self._static_explain(code, language)
 
-        if HAS_OLLAMA and chat:
+    async def astream_explain(self, code: str, detail_level: str = "medium", use_cache: bool = True) -> AsyncIterator[str]:
+        """Async version of explain_code_stream()."""
+        language = self.detect_language(code)
+        prompt = self._explain_prompt(code, language, detail_level)
+
+        if HAS_OLLAMA and async_chat_stream:
             try:
-                response = chat(prompt, model=self.model)
-                return response
+                async for chunk in self._achat_stream(prompt, use_cache=use_cache):
+                    yield chunk
             except Exception as e:
-                return f"AI explanation unavailable: {e}\n\nLanguage detected: {language}"
+                yield f"AI explanation unavailable: {e}\n\nLanguage detected: {language}"
         else:
-            # Fallback: basic static analysis
-            return self._static_explain(code, language)
+            yield self._static_explain(code, language)
+
+    async def aexplain_batch(self, codes: List[str], detail_level: str = "medium") -> List[str]:
+        """Explain several snippets concurrently.
+
+        Requests overlap on the Ollama server; how many actually run in
+        parallel is bounded by its OLLAMA_NUM_PARALLEL setting.
+        """
+        return list(await asyncio.gather(*(self.aexplain_code(c, detail_level) for c in codes)))
+
+    def explain_batch(self, codes: List[str], detail_level: str = "medium") -> List[str]:
+        """Sync wrapper for aexplain_batch() (not for use inside a running event loop)."""
+        return asyncio.run(self.aexplain_batch(codes, detail_level))
+
+    def _explain_prompt(self, code: str, language: str, detail_level: str) -> str:
+        """Build the explanation prompt for a detail level."""
+        if detail_level not in ("brief", "detailed"):
+            detail_level = "medium"
+        return _prompt_head(f"explain_{detail_level}", language) + code + "\n```"
 
     def _static_explain(self, code: str, language: str) -> str:
         """Provide basic static analysis without AI."""
-        lines = code.strip().split('\n')
-        line_count = len(lines)
+        line_count = code.strip().count('\n') + 1
 
         explanation = [f"Language: {language}", f"Lines: {line_count}"]
 
         if language == Language.PYTHON.value:
             # Count Python constructs
-            functions = len(re.findall(r'\bdef \w+', code))
-            classes = len(re.findall(r'\bclass \w+', code))
-            imports = len(re.findall(r'^(?:import|from)\s+', code, re.MULTILINE))
+            counts = {'def': 0, 'class': 0, 'imp': 0}
+            for match in _PY_CONSTRUCTS_RE.finditer(code):
+                counts[match.lastgroup] += 1
+            functions, classes, imports = counts['def'], counts['class'], counts['imp']
 
             if functions:
                 explanation.append(f"Functions: {functions}")
@@ -215,7 +724,7 @@ Describe what it does, its main components, and how they work together."""
                 explanation.append(f"Imports: {imports}")
 
         elif language == Language.JAVASCRIPT.value:
-            functions = len(re.findall(r'\bfunction\s+\w+|\b\w+\s*=\s*(?:async\s*)?\(', code))
+            functions = len(_JS_FUNC_RE.findall(code))
             if functions:
                 explanation.append(f"Functions: {functions}")
 
@@ -239,21 +748,11 @@ Describe what it does, its main components, and how they work together."""
         """
         comment_instruction = "Include helpful comments." if include_comments else "No comments needed."
 
-        prompt = f"""Write {language} code that does the following:
-
-{description}
+        prompt = _prompt_head('write', language, comment_instruction) + f"{description}\n\n```{language}"
 
-Requirements:
-- Clean, readable code
-- Follow {language} best practices
-- {comment_instruction}
-- Only output the code, no explanations
-
-```{language}"""
-
-        if HAS_OLLAMA and chat:
+        if HAS_OLLAMA and chat_stream:
             try:
-                response = chat(prompt, model=self.model)
+                response = self._stream_code_block(prompt, language)
                 # Extract code from response
                 code = self._extract_code(response, language)
                 return code
@@ -262,29 +761,35 @@ Requirements:
         else:
             return f"# AI code generation unavailable\n# Description: {description}"
 
-    def _extract_code(self, response: str, language: str) -> str:
-        """Extract code block from AI response."""
-        # Try to find code block
-        patterns = [
-            rf'```{language}\n(.*?)```',
-            r'```\n(.*?)```',
-            rf'```{language}(.*?)```',
-        ]
+    def _stream_code_block(self, prompt: str, language: str) -> str:
+        """Stream a code-writing reply and stop once its code block closes.
 
-        for pattern in patterns:
-            match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        Whatever the model adds after the block (usually an unwanted
+        explanation) is never generated.
+        """
+        stream = self._chat_stream(prompt)
+        text = ''
+        try:
+            for chunk in stream:
+                text += chunk
+                if _code_block_end(text) is not None:
+                    break
+        finally:
+            stream.close()  # Drops the HTTP stream so Ollama stops generating
 
-        # No code block found, return as-is (might be plain code)
-        return response.strip()
+        return text
+
+    def _extract_code(self, response: str, language: str) -> str:
+        """Extract code block from AI response."""
+        return _extract_code_block(response, language)
 
-    def fix_code(self, code: str, error: Optional[str] = None) -> str:
+    def fix_code(self, code: str, error: Optional[str] = None, use_cache: bool = True) -> str:
         """Fix errors in code.
 
         Args:
             code: Broken code
             error: Optional error message
+            use_cache: Reuse the reply for an identical earlier request
 
         Returns:
             Fixed code string
@@ -292,28 +797,13 @@ Requirements:
         language = self.detect_language(code)
 
         if error:
-            prompt = f"""Fix this {language} code that has the following error:
-
-Error: {error}
-
-Code:
-```{language}
-{code}
-```
-
-Provide only the corrected code:"""
+            prompt = _prompt_head('fix_error', language) + f"{code}\n```\n\nError: {error}"
         else:
-            prompt = f"""Review and fix any issues in this {language} code:
-
-```{language}
-{code}
-```
-
-Fix any bugs, syntax errors, or logic issues. Provide only the corrected code:"""
+            prompt = _prompt_head('fix', language) + code + "\n```"
 
         if HAS_OLLAMA and chat:
             try:
-                response = chat(prompt, model=self.model)
+                response = self._chat(prompt, use_cache=use_cache)
                 return self._extract_code(response, language)
             except Exception as e:
                 return f"# Fix failed: {e}\n{code}"
@@ -341,6 +831,13 @@ Fix any bugs, syntax errors, or logic issues. Provide only the corrected code:""
         if language is None:
             language = self.detect_language(code)
 
+        if language == Language.PYTHON.value and self._py_worker is not None:
+            # The worker's interpreter boots in parallel with the safety scan
+            try:
+                self._py_worker.warm()
+            except Exception:
+                pass  # _run_python falls back to a fresh process
+
         # Safety check
         if safe_mode and self._is_dangerous(code, language):
             return CodeResult(
@@ -370,35 +867,48 @@ Fix any bugs, syntax errors, or logic issues. Provide only the corrected code:""
 
     def _is_dangerous(self, code: str, language: str) -> bool:
         """Check if code contains dangerous operations."""
-        dangerous_patterns = [
-            r'\brm\s+-rf\b',
-            r'\bformat\s+[a-z]:\b',
-            r'\bdel\s+/[sf]\b',
-            r'os\.remove|os\.unlink|shutil\.rmtree',
-            r'subprocess\.call.*shell\s*=\s*True',
-            r'\beval\s*\(',
-            r'\bexec\s*\(',
-            r'__import__',
-            r'open\s*\([^)]*["\']w["\']',
-            r'DROP\s+TABLE|DELETE\s+FROM|TRUNCATE',
-        ]
-
-        code_lower = code.lower()
-        for pattern in dangerous_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                return True
-
-        return False
+        return _DANGEROUS_RE.search(code) is not None
 
     def _run_python(self, code: str, timeout: int) -> CodeResult:
-        """Execute Python code."""
-        # Write to temp file
-        temp_file = self._temp_dir / "temp_script.py"
-        temp_file.write_text(code, encoding='utf-8')
+        """Execute Python code on the warm worker, falling back to a fresh process."""
+        if self._py_worker is None:
+            return self._run_python_process(code, timeout)
+        try:
+            stdout, stderr, return_code = self._py_worker.run(code, timeout)
+        except subprocess.TimeoutExpired:
+            return CodeResult(
+                success=False,
+                output="",
+                error=f"Execution timed out after {timeout} seconds",
+                return_code=-1,
+                language=Language.PYTHON.value
+            )
+        except _WorkerCrashed as e:
+            # The snippet already ran (and took the worker down); never run it twice
+            return CodeResult(
+                success=False,
+                output="",
+                error=str(e),
+                return_code=-1,
+                language=Language.PYTHON.value
+            )
+        except OSError:
+            # The snippet never reached a worker
+            return self._run_python_process(code, timeout)
+        return CodeResult(
+            success=return_code == 0,
+            output=stdout,
+            error=stderr,
+            return_code=return_code,
+            language=Language.PYTHON.value
+        )
 
+    def _run_python_process(self, code: str, timeout: int) -> CodeResult:
+        """Execute Python code in a fresh interpreter (program read from stdin)."""
         try:
             result = subprocess.run(
-                [sys.executable, str(temp_file)],
+                [sys.executable, "-"],
+                input=code,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -427,18 +937,13 @@ Fix any bugs, syntax errors, or logic issues. Provide only the corrected code:""
                 return_code=-1,
                 language=Language.PYTHON.value
             )
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
 
     def _run_javascript(self, code: str, timeout: int) -> CodeResult:
-        """Execute JavaScript code using Node.js."""
-        temp_file = self._temp_dir / "temp_script.js"
-        temp_file.write_text(code, encoding='utf-8')
-
+        """Execute JavaScript code using Node.js (program read from stdin)."""
         try:
             result = subprocess.run(
-                ["node", str(temp_file)],
+                ["node", "-"],
+                input=code,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -475,9 +980,6 @@ Fix any bugs, syntax errors, or logic issues. Provide only the corrected code:""
                 return_code=-1,
                 language=Language.JAVASCRIPT.value
             )
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
 
     def _run_bash(self, code: str, timeout: int) -> CodeResult:
         """Execute Bash code."""
@@ -580,47 +1082,54 @@ Fix any bugs, syntax errors, or logic issues. Provide only the corrected code:""
                 language=Language.POWERSHELL.value
             )
 
-    def analyze_code(self, code: str) -> CodeAnalysis:
+    def analyze_code(self, code: str, use_cache: bool = True) -> CodeAnalysis:
         """Analyze code for issues and suggestions.
 
         Args:
             code: Code to analyze
+            use_cache: Reuse the reply for an identical earlier request
 
         Returns:
             CodeAnalysis with findings
         """
         language = self.detect_language(code)
+        prompt = self._analyze_prompt(code, language)
 
-        prompt = f"""Analyze this {language} code:
-
-```{language}
-{code}
-```
+        if HAS_OLLAMA and chat:
+            try:
+                return self._parse_analysis(self._chat(prompt, use_cache=use_cache), language)
+            except Exception:
+                pass
 
-Provide:
-1. Brief summary (one sentence)
-2. Detailed explanation
-3. List of issues/bugs found
-4. List of improvement suggestions
+        # Fallback to basic static analysis
+        return self._static_analysis(code, language)
 
-Format as:
-SUMMARY: ...
-EXPLANATION: ...
-ISSUES:
-- issue 1
-- issue 2
-SUGGESTIONS:
-- suggestion 1
-- suggestion 2"""
+    async def aanalyze_code(self, code: str, use_cache: bool = True) -> CodeAnalysis:
+        """Async version of analyze_code()."""
+        language = self.detect_language(code)
+        prompt = self._analyze_prompt(code, language)
 
-        if HAS_OLLAMA and chat:
+        if HAS_OLLAMA and async_chat:
             try:
-                response = chat(prompt, model=self.model)
-                return self._parse_analysis(response, language)
-            except Exception as e:
+                return self._parse_analysis(await self._achat(prompt, use_cache=use_cache), language)
+            except Exception:
                 pass
+        return self._static_analysis(code, language)
 
-        # Fallback to basic static analysis
+    async def aanalyze_batch(self, codes: List[str]) -> List[CodeAnalysis]:
+        """Analyze several snippets concurrently (see aexplain_batch)."""
+        return list(await asyncio.gather(*(self.aanalyze_code(c) for c in codes)))
+
+    def analyze_batch(self, codes: List[str]) -> List[CodeAnalysis]:
+        """Sync wrapper for aanalyze_batch() (not for use inside a running event loop)."""
+        return asyncio.run(self.aanalyze_batch(codes))
+
+    def _analyze_prompt(self, code: str, language: str) -> str:
+        """Build the analysis prompt."""
+        return _prompt_head('analyze', language) + code + "\n```"
+
+    def _static_analysis(self, code: str, language: str) -> CodeAnalysis:
+        """Basic analysis without AI."""
         return CodeAnalysis(
             language=language,
             summary=f"{language} code with {len(code.splitlines())} lines",
@@ -638,24 +1147,24 @@ SUGGESTIONS:
 
         # Extract sections
         if "SUMMARY:" in response:
-            match = re.search(r'SUMMARY:\s*(.+?)(?=EXPLANATION:|ISSUES:|$)', response, re.DOTALL)
+            match = _SECTION_RES['SUMMARY'].search(response)
             if match:
                 summary = match.group(1).strip()
 
         if "EXPLANATION:" in response:
-            match = re.search(r'EXPLANATION:\s*(.+?)(?=ISSUES:|SUGGESTIONS:|$)', response, re.DOTALL)
+            match = _SECTION_RES['EXPLANATION'].search(response)
             if match:
                 explanation = match.group(1).strip()
 
         if "ISSUES:" in response:
-            match = re.search(r'ISSUES:\s*(.+?)(?=SUGGESTIONS:|$)', response, re.DOTALL)
+            match = _SECTION_RES['ISSUES'].search(response)
             if match:
                 issues_text = match.group(1)
                 issues = [line.strip().lstrip('- ') for line in issues_text.split('\n')
                          if line.strip() and line.strip() != '-']
 
         if "SUGGESTIONS:" in response:
-            match = re.search(r'SUGGESTIONS:\s*(.+?)$', response, re.DOTALL)
+            match = _SECTION_RES['SUGGESTIONS'].search(response)
             if match:
                 sugg_text = match.group(1)
                 suggestions = [line.strip().lstrip('- ') for line in sugg_text.split('\n')
@@ -765,8 +1274,8 @@ def analyze_code(code: str) -> CodeAnalysis:
 
 
 def detect_language(code: str) -> str:
-    """Detect programming language from code."""
-    return get_code_assistant().detect_language(code)
+    """Detect programming language from code (memoized per snippet)."""
+    return _detect_language(code)
 
 
 # Module test
@@ -28,7 +28,8 @@ import subprocess
 import webbrowser
 from pathlib import Path
 from urllib.parse import quote
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 # Config paths
 PROJECT_DIR = Path(__file__).parent.parent
@@ -36,15 +37,27 @@ CONFIG_DIR = PROJECT_DIR / 'config'
 DATA_DIR = PROJECT_DIR / 'data'
 CONTACTS_FILE = DATA_DIR / 'contacts.json'
 
+
+@lru_cache(maxsize=8)
+def _read_json(path: Path, stamp: Tuple[int, int]) -> Any:
+    """Parse a JSON file; stamp is (mtime_ns, size) so edits miss the cache."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _load_json(path: Path) -> Any:
+    """Load a JSON file, re-parsing only when it changed on disk."""
+    st = path.stat()
+    return _read_json(path, (st.st_mtime_ns, st.st_size))
+
+
 # Load user name from settings
 def get_user_name() -> str:
     """Get user's name from settings."""
     settings_file = CONFIG_DIR / 'settings.json'
     if settings_file.exists():
         try:
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-                return settings.get('user_name', 'Your friend')
+            return _load_json(settings_file).get('user_name', 'Your friend')
         except:
             pass
     return 'Your friend'
@@ -57,8 +70,8 @@ def load_contacts() -> Dict[str, str]:
     """
     if CONTACTS_FILE.exists():
         try:
-            with open(CONTACTS_FILE, 'r') as f:
-                return json.load(f)
+            # Copy so callers can mutate without touching the cache
+            return dict(_load_json(CONTACTS_FILE))
         except:
             pass
     return {}
@@ -100,16 +113,18 @@ def add_contact(name: str, email: str) -> Dict[str, Any]:
     }
 
 
-def get_contact_email(name: str) -> Optional[str]:
+def get_contact_email(name: str, contacts: Dict[str, str] = None) -> Optional[str]:
     """Look up email address by contact name.
 
     Args:
         name: Contact name to look up
+        contacts: Already-loaded address book (loaded from disk if omitted)
 
     Returns:
         Email address or None if not found
     """
-    contacts = load_contacts()
+    if contacts is None:
+        contacts = load_contacts()
     name_lower = name.lower().strip()
 
     # Exact match
@@ -157,15 +172,45 @@ def send_email(
     Returns:
         dict with success status
     """
+    return _send_email(to, message, subject, get_user_name(), None)
+
+
+def send_emails(messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Open pre-filled emails for several recipients.
+
+    Settings and contacts are read once for the whole batch rather than
+    once per message.
+
+    Args:
+        messages: List of dicts with 'to', 'message' and optional 'subject'
+
+    Returns:
+        List of send_email results, in order
+    """
     user_name = get_user_name()
+    contacts = load_contacts()
+    return [
+        _send_email(m['to'], m['message'], m.get('subject'), user_name, contacts)
+        for m in messages
+    ]
+
 
+def _send_email(
+    to: str,
+    message: str,
+    subject: Optional[str],
+    user_name: str,
+    contacts: Optional[Dict[str, str]]
+) -> Dict[str, Any]:
+    """Build and open the mailto link for one email."""
     # Check if 'to' is a name (look up in contacts)
     recipient_email = to
     recipient_name = to
 
     if '@' not in to:
         # It's a name, look up email
-        email_lookup = get_contact_email(to)
+        email_lookup = get_contact_email(to, contacts)
         if email_lookup:
             recipient_email = email_lookup
             recipient_name = to.title()
@@ -6,11 +6,28 @@ Per ARCHITECTURE.md: Open, create, search, move, copy, delete files.
 """
 
 import os
+import atexit
+import errno
 import shutil
 import json
+import heapq
+import stat
+import logging
 import datetime
+import threading
+from operator import itemgetter
 from pathlib import Path
 
+# Child of the 'cora' logger, so messages reach CORA's log file and console
+log = logging.getLogger('cora.files')
+
+# Fast JSON serialization for write_json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def _validate_path(file_path: str, base_dir: str = None) -> bool:
     """Validate a path to prevent directory traversal attacks.
@@ -66,6 +83,118 @@ def _safe_path(file_path: str, base_dir: str = None) -> str:
     return str(Path(file_path).resolve())
 
 
+# Write coalescing for append_file(buffered=True): pending bytes per
+# absolute path, written with one open/write/close when a path reaches
+# _APPEND_MAX_PENDING bytes, after _APPEND_FLUSH_DELAY seconds, or at exit.
+# No file handle stays open between flushes.
+_APPEND_MAX_PENDING = 1 << 16
+_APPEND_FLUSH_DELAY = 0.25
+_append_pending = {}
+_append_lock = threading.Lock()
+_append_timer = None
+
+
+def _write_pending(path, data):
+    try:
+        with open(path, 'ab') as f:
+            f.write(data)
+    except Exception as e:
+        log.error("Failed to flush appends to %s: %s", path, e)
+
+
+def flush_appends(file_path=None):
+    """Write out buffered appends (for one file, or all of them).
+
+    Args:
+        file_path: File to flush; None flushes every pending file
+    """
+    global _append_timer
+    with _append_lock:
+        if file_path is None:
+            pending = list(_append_pending.items())
+            _append_pending.clear()
+            if _append_timer is not None:
+                _append_timer.cancel()
+                _append_timer = None
+        else:
+            path = os.path.abspath(file_path)
+            data = _append_pending.pop(path, None)
+            pending = [(path, data)] if data else []
+        # Written under the lock so appends to a file stay in order
+        for path, data in pending:
+            _write_pending(path, data)
+
+
+atexit.register(flush_appends)
+
+
+def _buffer_append(file_path, content, create_if_missing):
+    """Queue content for a coalesced append; returns False if the file is missing."""
+    global _append_timer
+    path = os.path.abspath(file_path)
+    # Same newline translation as a text-mode write
+    data = (content.replace('\n', os.linesep) if os.linesep != '\n' else content).encode('utf-8')
+    with _append_lock:
+        buf = _append_pending.get(path)
+        if buf is None:
+            if not create_if_missing and not os.path.exists(path):
+                return False
+            buf = _append_pending[path] = bytearray()
+        buf += data
+        if len(buf) >= _APPEND_MAX_PENDING:
+            _write_pending(path, _append_pending.pop(path))
+        elif _append_timer is None:
+            _append_timer = threading.Timer(_APPEND_FLUSH_DELAY, _flush_on_timer)
+            _append_timer.daemon = True
+            _append_timer.start()
+    return True
+
+
+def _flush_on_timer():
+    global _append_timer
+    with _append_lock:
+        _append_timer = None
+    flush_appends()
+
+
+def _fastcopy(source, destination):
+    """shutil.copy2 that lets the filesystem clone the data when it can.
+
+    shutil already copies with sendfile/fcopyfile or a 1 MiB buffer; on
+    Linux os.copy_file_range additionally allows reflinks and server-side
+    copies (NFS, CIFS), so the data never passes through this process.
+    Falls back to shutil.copy2 wherever that is unsupported.
+    """
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    # Opening the destination truncates it, so rule out copying a file onto itself first
+    try:
+        same = os.path.samefile(source, destination)
+    except OSError:
+        same = False  # Destination doesn't exist yet
+    if same:
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+                infd, outfd = fsrc.fileno(), fdst.fileno()
+                copied = 0
+                while True:
+                    sent = os.copy_file_range(infd, outfd, 1 << 30)
+                    if not sent:
+                        break
+                    copied += sent
+                if not copied:
+                    # procfs, sysfs and some FUSE/network filesystems report
+                    # nothing to copy at offset 0; read them the normal way
+                    shutil.copyfileobj(fsrc, fdst)
+            shutil.copystat(source, destination)
+            return destination
+        except OSError:
+            pass  # Unsupported filesystem or cross-device on older kernels
+    return shutil.copy2(source, destination)
+
+
 def create_file(file_path, content='', overwrite=False):
     """Create a new file with optional content.
 
@@ -80,24 +209,26 @@ def create_file(file_path, content='', overwrite=False):
     try:
         # Validate path to prevent traversal attacks
         if not _validate_path(file_path):
-            print(f"[!] Invalid path: {file_path}")
+            log.warning("Invalid path: %s", file_path)
             return False
 
-        if os.path.exists(file_path) and not overwrite:
-            print(f"[!] File already exists: {file_path}")
-            return False
+        flush_appends(file_path)
 
         # Create directory if needed
         directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
-        with open(file_path, 'w', encoding='utf-8') as f:
+        # 'x' fails atomically if the file exists, no separate exists() check
+        with open(file_path, 'w' if overwrite else 'x', encoding='utf-8') as f:
             f.write(content)
 
         return True
+    except FileExistsError:
+        log.warning("File already exists: %s", file_path)
+        return False
     except Exception as e:
-        print(f"[!] Failed to create file: {e}")
+        log.error("Failed to create file: %s", e)
         return False
 
 
@@ -114,47 +245,63 @@ def read_file(file_path, encoding='utf-8'):
     try:
         # Validate path to prevent traversal attacks
         if not _validate_path(file_path):
-            print(f"[!] Invalid path: {file_path}")
+            log.warning("Invalid path: %s", file_path)
             return None
 
-        if not os.path.exists(file_path):
-            print(f"[!] File not found: {file_path}")
-            return None
+        flush_appends(file_path)
 
         with open(file_path, 'r', encoding=encoding) as f:
             return f.read()
+    except FileNotFoundError:
+        log.warning("File not found: %s", file_path)
+        return None
     except Exception as e:
-        print(f"[!] Failed to read file: {e}")
+        log.error("Failed to read file: %s", e)
         return None
 
 
-def append_file(file_path, content, create_if_missing=True):
+def append_file(file_path, content, create_if_missing=True, buffered=False):
     """Append content to file.
 
     Args:
         file_path: Path to file
         content: Content to append
         create_if_missing: Create file if it doesn't exist
+        buffered: Coalesce with other buffered appends and write within
+            250 ms (or at 64 KiB / exit); use for frequent small log-style
+            writes that don't need to be on disk immediately
 
     Returns:
-        bool: True if appended successfully
+        bool: True if appended (or queued) successfully
     """
     try:
         # Validate path to prevent traversal attacks
         if not _validate_path(file_path):
-            print(f"[!] Invalid path: {file_path}")
+            log.warning("Invalid path: %s", file_path)
             return False
 
-        if not os.path.exists(file_path) and not create_if_missing:
-            print(f"[!] File not found: {file_path}")
-            return False
+        if buffered:
+            if not _buffer_append(file_path, content, create_if_missing):
+                log.warning("File not found: %s", file_path)
+                return False
+            return True
 
-        with open(file_path, 'a', encoding='utf-8') as f:
+        # Keep unbuffered writes ordered after earlier buffered ones
+        flush_appends(file_path)
+
+        # Without O_CREAT the open itself reports a missing file
+        flags = os.O_WRONLY | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+        if create_if_missing:
+            flags |= os.O_CREAT
+        with os.fdopen(os.open(file_path, flags, 0o666), 'a', encoding='utf-8') as f:
             f.write(content)
 
         return True
+    except FileNotFoundError:
+        log.warning("File not found: %s", file_path)
+        return False
     except Exception as e:
-        print(f"[!] Failed to append to file: {e}")
+        log.error("Failed to append to file: %s", e)
         return False
 
 
@@ -171,17 +318,18 @@ def delete_file(file_path, confirm=True):
     try:
         # Validate path to prevent traversal attacks
         if not _validate_path(file_path):
-            print(f"[!] Invalid path: {file_path}")
+            log.warning("Invalid path: %s", file_path)
             return False
 
-        if not os.path.exists(file_path):
-            print(f"[!] File not found: {file_path}")
-            return False
+        flush_appends(file_path)
 
         os.remove(file_path)
         return True
+    except FileNotFoundError:
+        log.warning("File not found: %s", file_path)
+        return False
     except Exception as e:
-        print(f"[!] Failed to delete file: {e}")
+        log.error("Failed to delete file: %s", e)
         return False
 
 
@@ -199,29 +347,42 @@ def move_file(source, destination, overwrite=False):
     try:
         # Validate both paths to prevent traversal attacks
         if not _validate_path(source):
-            print(f"[!] Invalid source path: {source}")
+            log.warning("Invalid source path: %s", source)
             return False
         if not _validate_path(destination):
-            print(f"[!] Invalid destination path: {destination}")
+            log.warning("Invalid destination path: %s", destination)
             return False
 
-        if not os.path.exists(source):
-            print(f"[!] Source not found: {source}")
-            return False
+        flush_appends(source)
 
-        if os.path.exists(destination) and not overwrite:
-            print(f"[!] Destination already exists: {destination}")
+        if not overwrite and os.path.lexists(destination):
+            log.warning("Destination already exists: %s", destination)
             return False
 
         # Create destination directory if needed
         dest_dir = os.path.dirname(destination)
-        if dest_dir and not os.path.exists(dest_dir):
-            os.makedirs(dest_dir)
-
-        shutil.move(source, destination)
+        if dest_dir:
+            os.makedirs(dest_dir, exist_ok=True)
+
+        try:
+            # Same filesystem: one directory-entry update
+            os.replace(source, destination)
+        except FileNotFoundError:
+            raise
+        except OSError as e:
+            if e.errno == errno.EXDEV and os.path.isfile(source):
+                # Cross-device file: copy, then drop the original
+                _fastcopy(source, destination)
+                os.unlink(source)
+            else:
+                # Directory targets and other special cases
+                shutil.move(source, destination, copy_function=_fastcopy)
         return True
+    except FileNotFoundError:
+        log.warning("Source not found: %s", source)
+        return False
     except Exception as e:
-        print(f"[!] Failed to move file: {e}")
+        log.error("Failed to move file: %s", e)
         return False
 
 
@@ -239,29 +400,30 @@ def copy_file(source, destination, overwrite=False):
     try:
         # Validate both paths to prevent traversal attacks
         if not _validate_path(source):
-            print(f"[!] Invalid source path: {source}")
+            log.warning("Invalid source path: %s", source)
             return False
         if not _validate_path(destination):
-            print(f"[!] Invalid destination path: {destination}")
+            log.warning("Invalid destination path: %s", destination)
             return False
 
-        if not os.path.exists(source):
-            print(f"[!] Source not found: {source}")
-            return False
+        flush_appends(source)
 
-        if os.path.exists(destination) and not overwrite:
-            print(f"[!] Destination already exists: {destination}")
+        if not overwrite and os.path.lexists(destination):
+            log.warning("Destination already exists: %s", destination)
             return False
 
         # Create destination directory if needed
         dest_dir = os.path.dirname(destination)
-        if dest_dir and not os.path.exists(dest_dir):
-            os.makedirs(dest_dir)
+        if dest_dir:
+            os.makedirs(dest_dir, exist_ok=True)
 
-        shutil.copy2(source, destination)
+        _fastcopy(source, destination)
         return True
+    except FileNotFoundError:
+        log.warning("Source not found: %s", source)
+        return False
     except Exception as e:
-        print(f"[!] Failed to copy file: {e}")
+        log.error("Failed to copy file: %s", e)
         return False
 
 
@@ -278,16 +440,14 @@ def rename_file(file_path, new_name):
     try:
         # Validate path to prevent traversal attacks
         if not _validate_path(file_path):
-            print(f"[!] Invalid path: {file_path}")
+            log.warning("Invalid path: %s", file_path)
             return False
 
+        flush_appends(file_path)
+
         # Validate new_name doesn't contain path separators (traversal attempt)
         if os.sep in new_name or '/' in new_name or '\\' in new_name:
-            print(f"[!] Invalid filename (contains path separators): {new_name}")
-            return False
-
-        if not os.path.exists(file_path):
-            print(f"[!] File not found: {file_path}")
+            log.warning("Invalid filename (contains path separators): %s", new_name)
             return False
 
         directory = os.path.dirname(file_path)
@@ -295,13 +455,16 @@ def rename_file(file_path, new_name):
 
         # Validate the resulting path as well
         if not _validate_path(new_path):
-            print(f"[!] Invalid resulting path: {new_path}")
+            log.warning("Invalid resulting path: %s", new_path)
             return False
 
         os.rename(file_path, new_path)
         return True
+    except FileNotFoundError:
+        log.warning("File not found: %s", file_path)
+        return False
     except Exception as e:
-        print(f"[!] Failed to rename file: {e}")
+        log.error("Failed to rename file: %s", e)
         return False
 
 
@@ -315,26 +478,61 @@ def get_file_info(file_path):
         dict: File info or None if error
     """
     try:
-        if not os.path.exists(file_path):
-            return None
+        flush_appends(file_path)  # Size must include buffered appends
+
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None  # Missing or inaccessible, as os.path.exists reports
 
-        stat = os.stat(file_path)
+        # One stat call answers every field, including the type checks
+        name = os.path.basename(file_path)
         return {
             'path': file_path,
-            'name': os.path.basename(file_path),
-            'extension': os.path.splitext(file_path)[1],
-            'size_bytes': stat.st_size,
-            'size_kb': round(stat.st_size / 1024, 2),
-            'created': datetime.datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            'modified': datetime.datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            'is_file': os.path.isfile(file_path),
-            'is_dir': os.path.isdir(file_path),
+            'name': name,
+            'extension': os.path.splitext(name)[1],
+            'size_bytes': st.st_size,
+            'size_kb': round(st.st_size / 1024, 2),
+            'created': datetime.datetime.fromtimestamp(st.st_ctime).isoformat(),
+            'modified': datetime.datetime.fromtimestamp(st.st_mtime).isoformat(),
+            'is_file': stat.S_ISREG(st.st_mode),
+            'is_dir': stat.S_ISDIR(st.st_mode),
         }
     except Exception as e:
-        print(f"[!] Failed to get file info: {e}")
+        log.error("Failed to get file info: %s", e)
         return None
 
 
+def _scan_files(dir_path, extensions=None, recursive=False):
+    """Yield DirEntry objects for files under dir_path.
+
+    Entries come from os.scandir, so their type and stat() are served from
+    the directory read instead of a fresh syscall per file. Like os.walk,
+    unreadable subdirectories are skipped and directory symlinks are not
+    followed.
+    """
+    suffixes = tuple(extensions) if extensions is not None else None
+    stack = [dir_path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if recursive:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if entry.is_dir():
+                            continue  # Symlinked directory
+                    elif not entry.is_file():
+                        continue
+                    if suffixes is None or entry.name.endswith(suffixes):
+                        yield entry
+        except OSError:
+            if current is dir_path:
+                raise
+
+
 def list_directory(dir_path, extensions=None, recursive=False):
     """List files in a directory.
 
@@ -347,27 +545,13 @@ def list_directory(dir_path, extensions=None, recursive=False):
         list: File paths
     """
     try:
-        if not os.path.isdir(dir_path):
-            print(f"[!] Not a directory: {dir_path}")
-            return []
-
-        files = []
-
-        if recursive:
-            for root, dirs, filenames in os.walk(dir_path):
-                for filename in filenames:
-                    if extensions is None or any(filename.endswith(ext) for ext in extensions):
-                        files.append(os.path.join(root, filename))
-        else:
-            for item in os.listdir(dir_path):
-                item_path = os.path.join(dir_path, item)
-                if os.path.isfile(item_path):
-                    if extensions is None or any(item.endswith(ext) for ext in extensions):
-                        files.append(item_path)
-
-        return sorted(files)
+        flush_appends()  # Files created by buffered appends exist once flushed
+        return sorted(entry.path for entry in _scan_files(dir_path, extensions, recursive))
+    except (FileNotFoundError, NotADirectoryError):
+        log.warning("Not a directory: %s", dir_path)
+        return []
     except Exception as e:
-        print(f"[!] Failed to list directory: {e}")
+        log.error("Failed to list directory: %s", e)
         return []
 
 
@@ -383,16 +567,15 @@ def create_directory(dir_path):
     try:
         # Validate path to prevent traversal attacks
         if not _validate_path(dir_path):
-            print(f"[!] Invalid path: {dir_path}")
+            log.warning("Invalid path: %s", dir_path)
             return False
 
-        if os.path.exists(dir_path):
-            return True  # Already exists
-
-        os.makedirs(dir_path)
+        os.makedirs(dir_path, exist_ok=True)
         return True
+    except FileExistsError:
+        return True  # Already exists (as a file; directories pass exist_ok)
     except Exception as e:
-        print(f"[!] Failed to create directory: {e}")
+        log.error("Failed to create directory: %s", e)
         return False
 
 
@@ -407,9 +590,9 @@ def delete_directory(dir_path, recursive=False):
         bool: True if deleted successfully
     """
     try:
-        if not os.path.exists(dir_path):
-            print(f"[!] Directory not found: {dir_path}")
-            return False
+        # Buffered appends may target files inside it; write them out now
+        # rather than letting a later flush recreate them
+        flush_appends()
 
         if recursive:
             shutil.rmtree(dir_path)
@@ -417,8 +600,11 @@ def delete_directory(dir_path, recursive=False):
             os.rmdir(dir_path)  # Only works if empty
 
         return True
+    except FileNotFoundError:
+        log.warning("Directory not found: %s", dir_path)
+        return False
     except Exception as e:
-        print(f"[!] Failed to delete directory: {e}")
+        log.error("Failed to delete directory: %s", e)
         return False
 
 
@@ -432,12 +618,32 @@ def read_json(file_path):
         dict/list: Parsed JSON or None if error
     """
     try:
-        content = read_file(file_path)
-        if content is None:
+        # Validate path to prevent traversal attacks
+        if not _validate_path(file_path):
+            log.warning("Invalid path: %s", file_path)
             return None
+
+        flush_appends(file_path)
+
+        # Parse the raw bytes; no decoded str copy of the file is made
+        with open(file_path, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        log.warning("File not found: %s", file_path)
+        return None
+    except Exception as e:
+        log.error("Failed to read file: %s", e)
+        return None
+
+    try:
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass  # Let json decide: it also accepts NaN and a UTF-8 BOM
         return json.loads(content)
-    except json.JSONDecodeError as e:
-        print(f"[!] Invalid JSON: {e}")
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        log.warning("Invalid JSON: %s", e)
         return None
 
 
@@ -453,10 +659,37 @@ def write_json(file_path, data, indent=2):
         bool: True if written successfully
     """
     try:
-        content = json.dumps(data, indent=indent, ensure_ascii=False)
-        return create_file(file_path, content, overwrite=True)
+        # Validate path to prevent traversal attacks
+        if not _validate_path(file_path):
+            log.warning("Invalid path: %s", file_path)
+            return False
+
+        # Pending appends must land before the file is replaced, not after
+        flush_appends(file_path)
+
+        # Create directory if needed
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Serialize completely before opening (and truncating) the file, so
+        # unserializable data leaves the existing file intact.
+        # orjson emits UTF-8 bytes directly; it covers compact and 2-space
+        # output and rejects some types json accepts (e.g. int dict keys)
+        payload = None
+        if ORJSON_AVAILABLE and indent in (None, 0, 2):
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+            except TypeError:
+                pass
+        if payload is None:
+            payload = json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+
+        with open(file_path, 'wb') as f:
+            f.write(payload)
+        return True
     except Exception as e:
-        print(f"[!] Failed to write JSON: {e}")
+        log.error("Failed to write JSON: %s", e)
         return False
 
 
@@ -472,23 +705,40 @@ def search_in_file(file_path, query, case_sensitive=False):
         list: List of (line_number, line_content) tuples
     """
     try:
-        content = read_file(file_path)
-        if content is None:
+        # Validate path to prevent traversal attacks
+        if not _validate_path(file_path):
+            log.warning("Invalid path: %s", file_path)
             return []
 
-        results = []
-        lines = content.split('\n')
+        flush_appends(file_path)
 
-        search_query = query if case_sensitive else query.lower()
+        results = []
 
-        for i, line in enumerate(lines, 1):
-            search_line = line if case_sensitive else line.lower()
-            if search_query in search_line:
-                results.append((i, line.strip()))
+        # Match on raw bytes and decode only the lines that hit. bytes.lower()
+        # only folds ASCII, so non-ASCII case-insensitive queries compare
+        # decoded lines instead.
+        needle = query.encode('utf-8')
+        decode_each = not case_sensitive and not needle.isascii()
+        if decode_each:
+            search_query = query.lower()
+        elif not case_sensitive:
+            needle = needle.lower()
+
+        with open(file_path, 'rb', buffering=1 << 18) as f:
+            for i, raw in enumerate(f, 1):
+                if decode_each:
+                    line = raw.decode('utf-8', errors='replace')
+                    if search_query in line.lower():
+                        results.append((i, line.strip()))
+                elif needle in (raw if case_sensitive else raw.lower()):
+                    results.append((i, raw.decode('utf-8', errors='replace').strip()))
 
         return results
+    except FileNotFoundError:
+        log.warning("File not found: %s", file_path)
+        return []
     except Exception as e:
-        print(f"[!] Search error: {e}")
+        log.error("Search error: %s", e)
         return []
 
 
@@ -504,13 +754,21 @@ def get_recent_files(dir_path, limit=10, extensions=None):
         list: File paths sorted by modification time (newest first)
     """
     try:
-        files = list_directory(dir_path, extensions=extensions, recursive=True)
-
-        # Sort by modification time
-        files_with_time = [(f, os.path.getmtime(f)) for f in files]
-        files_with_time.sort(key=lambda x: x[1], reverse=True)
+        flush_appends()  # mtimes must reflect buffered appends
 
-        return [f[0] for f in files_with_time[:limit]]
+        # (path, mtime) pairs straight from scandir; keep only the newest
+        files_with_time = []
+        for entry in _scan_files(dir_path, extensions, recursive=True):
+            try:
+                files_with_time.append((entry.path, entry.stat().st_mtime))
+            except OSError:
+                continue  # Vanished or dangling symlink
+        newest = heapq.nlargest(limit, files_with_time, key=itemgetter(1))
+
+        return [f[0] for f in newest]
+    except (FileNotFoundError, NotADirectoryError):
+        log.warning("Not a directory: %s", dir_path)
+        return []
     except Exception as e:
-        print(f"[!] Failed to get recent files: {e}")
+        log.error("Failed to get recent files: %s", e)
         return []
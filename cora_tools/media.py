@@ -27,11 +27,37 @@
 
 import os
 import re
+import atexit
+import shutil
 import subprocess
+import threading
+import time
+import weakref
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+from functools import lru_cache, cached_property
 import json
+import logging
+
+# Faster decoding of Emby responses (accepts bytes directly)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP client for Emby
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+log = logging.getLogger('cora.media')
 
 # ================================================================
 # CONFIGURATION
@@ -44,6 +70,14 @@ MEDIA_CONFIG_FILE = CONFIG_DIR / 'media_config.json'
 AUDIO_EXTENSIONS = {'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', '.wma'}
 VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm'}
 MEDIA_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+# Case-insensitive "ends with a media extension" test for play() targets
+_MEDIA_EXT_RE = re.compile(
+    '(?:' + '|'.join(re.escape(ext) for ext in sorted(MEDIA_EXTENSIONS)) + r')\Z', re.IGNORECASE
+)
+
+
+# Parsed media_config.json, keyed by (mtime_ns, size) so edits are picked up
+_CONFIG_CACHE: Dict[str, Any] = {}
 
 
 def load_media_config() -> dict:
@@ -57,31 +91,120 @@ def load_media_config() -> dict:
         'emby_api_key': ''
     }
 
-    if MEDIA_CONFIG_FILE.exists():
+    try:
+        st = os.stat(MEDIA_CONFIG_FILE)
+    except OSError:
+        return default_config
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE.get('key') != key:
         try:
-            with open(MEDIA_CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                default_config.update(config)
+            config = _json_loads(MEDIA_CONFIG_FILE.read_bytes())
         except Exception:
-            pass
+            config = {}
+        _CONFIG_CACHE['key'] = key
+        _CONFIG_CACHE['val'] = config
 
+    default_config.update(_CONFIG_CACHE['val'])
     return default_config
 
 
+# Background requests that overlap with a caller's own I/O (threads start lazily)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cora-media')
+
+
 # ================================================================
 # SYSTEM MEDIA KEYS - Control ANY playing app
 # ================================================================
 
+@lru_cache(maxsize=1)
+def _input_struct():
+    """Build the user32 INPUT structure type (for SendInput) once."""
+    import ctypes
+    from ctypes import wintypes
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [('wVk', wintypes.WORD), ('wScan', wintypes.WORD),
+                    ('dwFlags', wintypes.DWORD), ('time', wintypes.DWORD),
+                    ('dwExtraInfo', ctypes.c_size_t)]
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [('dx', wintypes.LONG), ('dy', wintypes.LONG),
+                    ('mouseData', wintypes.DWORD), ('dwFlags', wintypes.DWORD),
+                    ('time', wintypes.DWORD), ('dwExtraInfo', ctypes.c_size_t)]
+
+    class HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [('uMsg', wintypes.DWORD), ('wParamL', wintypes.WORD), ('wParamH', wintypes.WORD)]
+
+    # The union must include every member so sizeof(INPUT) matches Windows
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [('mi', MOUSEINPUT), ('ki', KEYBDINPUT), ('hi', HARDWAREINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [('type', wintypes.DWORD), ('u', _INPUTUNION)]
+
+    return INPUT
+
+
 class SystemMediaControl:
     """
     Control system media playback using keyboard media keys.
     Works with Spotify, VLC, YouTube in browser, Windows Media Player, etc.
     """
 
+    KEYEVENTF_EXTENDEDKEY = 0x0001
+    KEYEVENTF_KEYUP = 0x0002
+    INPUT_KEYBOARD = 1
+
     def __init__(self):
         self.available = False
+        self._keybd_event = self._resolve_keybd_event()
+        self._send_input = self._resolve_send_input()
+        self._com = threading.local()  # Endpoint volume interface per COM thread
         self._init_backend()
 
+    @staticmethod
+    def _resolve_keybd_event():
+        """Look up user32.keybd_event once, with its signature declared."""
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            keybd_event = ctypes.windll.user32.keybd_event
+            keybd_event.argtypes = [wintypes.BYTE, wintypes.BYTE, wintypes.DWORD, ctypes.c_size_t]
+            keybd_event.restype = None
+            return keybd_event
+        except Exception:
+            return None  # Not on Windows
+
+    @staticmethod
+    def _resolve_send_input():
+        """Look up user32.SendInput once, with its signature declared."""
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            send_input = ctypes.windll.user32.SendInput
+            send_input.argtypes = [wintypes.UINT, ctypes.POINTER(_input_struct()), ctypes.c_int]
+            send_input.restype = wintypes.UINT
+            return send_input
+        except Exception:
+            return None  # Not on Windows
+
+    def _endpoint_volume(self):
+        """Return the speakers' IAudioEndpointVolume, activated once per thread."""
+        volume = getattr(self._com, 'volume', None)
+        if volume is None:
+            from ctypes import cast, POINTER
+            from comtypes import CLSCTX_ALL
+            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            volume = cast(interface, POINTER(IAudioEndpointVolume))
+            self._com.volume = volume
+        return volume
+
     def _init_backend(self):
         """Initialize the best available backend for media keys."""
         # Try pycaw for Windows audio control
@@ -121,30 +244,34 @@ class SystemMediaControl:
         except:
             self._backend = None
 
-    def _send_media_key(self, key_code: int) -> bool:
-        """Send a media key press using Windows API."""
+    def _send_media_key(self, key_code: int, presses: int = 1) -> bool:
+        """Send a media key press (or several) using Windows API."""
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            user32 = ctypes.windll.user32
-
-            # Virtual key codes for media keys
-            VK_MEDIA_PLAY_PAUSE = 0xB3
-            VK_MEDIA_NEXT_TRACK = 0xB0
-            VK_MEDIA_PREV_TRACK = 0xB1
-            VK_MEDIA_STOP = 0xB2
-            VK_VOLUME_MUTE = 0xAD
-            VK_VOLUME_DOWN = 0xAE
-            VK_VOLUME_UP = 0xAF
-
-            KEYEVENTF_EXTENDEDKEY = 0x0001
-            KEYEVENTF_KEYUP = 0x0002
-
-            # Key down
-            user32.keybd_event(key_code, 0, KEYEVENTF_EXTENDEDKEY, 0)
-            # Key up
-            user32.keybd_event(key_code, 0, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP, 0)
+            down = self.KEYEVENTF_EXTENDEDKEY
+            up = self.KEYEVENTF_EXTENDEDKEY | self.KEYEVENTF_KEYUP
+
+            count = 2 * presses  # Alternating down/up events
+            sent = 0
+            if self._send_input is not None:
+                # Every down/up event in one SendInput call
+                import ctypes
+
+                INPUT = _input_struct()
+                events = (INPUT * count)()
+                for i in range(count):
+                    events[i].type = self.INPUT_KEYBOARD
+                    events[i].u.ki.wVk = key_code
+                    events[i].u.ki.dwFlags = up if i % 2 else down
+                sent = self._send_input(count, events, ctypes.sizeof(INPUT))
+                if sent == count:
+                    return True
+
+            if self._keybd_event is None:
+                raise OSError("keybd_event unavailable")
+
+            # Only the events SendInput did not inject (all of them if it failed)
+            for i in range(sent, count):
+                self._keybd_event(key_code, 0, up if i % 2 else down, 0)
 
             return True
         except Exception as e:
@@ -186,15 +313,13 @@ class SystemMediaControl:
     def volume_up(self, steps: int = 2) -> dict:
         """Increase volume."""
         VK_VOLUME_UP = 0xAF
-        for _ in range(steps):
-            self._send_media_key(VK_VOLUME_UP)
+        self._send_media_key(VK_VOLUME_UP, steps)
         return {'success': True, 'action': 'volume_up', 'steps': steps}
 
     def volume_down(self, steps: int = 2) -> dict:
         """Decrease volume."""
         VK_VOLUME_DOWN = 0xAE
-        for _ in range(steps):
-            self._send_media_key(VK_VOLUME_DOWN)
+        self._send_media_key(VK_VOLUME_DOWN, steps)
         return {'success': True, 'action': 'volume_down', 'steps': steps}
 
     def mute(self) -> dict:
@@ -206,13 +331,7 @@ class SystemMediaControl:
     def set_volume(self, level: int) -> dict:
         """Set volume to specific level (0-100)."""
         try:
-            from ctypes import cast, POINTER
-            from comtypes import CLSCTX_ALL
-            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume = cast(interface, POINTER(IAudioEndpointVolume))
+            volume = self._endpoint_volume()
 
             # Convert 0-100 to 0.0-1.0
             volume.SetMasterVolumeLevelScalar(level / 100.0, None)
@@ -220,21 +339,15 @@ class SystemMediaControl:
         except ImportError:
             return {'success': False, 'error': 'pycaw not installed. Run: pip install pycaw'}
         except Exception as e:
+            self._com.volume = None  # Default device may have changed
             return {'success': False, 'error': str(e)}
 
     def get_volume(self) -> int:
         """Get current volume level (0-100)."""
         try:
-            from ctypes import cast, POINTER
-            from comtypes import CLSCTX_ALL
-            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume = cast(interface, POINTER(IAudioEndpointVolume))
-
-            return int(volume.GetMasterVolumeLevelScalar() * 100)
+            return int(self._endpoint_volume().GetMasterVolumeLevelScalar() * 100)
         except:
+            self._com.volume = None
             return -1
 
 
@@ -242,6 +355,25 @@ class SystemMediaControl:
 # LOCAL FILE PLAYBACK
 # ================================================================
 
+@lru_cache(maxsize=None)
+def _discover_player() -> tuple:
+    """Find mpv or VLC once per process. Returns (player_path, player_name)."""
+    # Check for mpv, then VLC: known install locations first, then PATH
+    candidates = (
+        ('mpv', (r'C:\Program Files\mpv\mpv.exe', r'C:\Program Files (x86)\mpv\mpv.exe')),
+        ('vlc', (r'C:\Program Files\VideoLAN\VLC\vlc.exe', r'C:\Program Files (x86)\VideoLAN\VLC\vlc.exe')),
+    )
+    for name, paths in candidates:
+        for path in paths:
+            if os.path.exists(path):
+                return (path, name)
+        if shutil.which(name):
+            return (name, name)
+
+    # Fallback to system default
+    return ('default', 'default')
+
+
 class LocalMediaPlayer:
     """Play local media files (MP3, MP4, etc)."""
 
@@ -255,36 +387,11 @@ class LocalMediaPlayer:
 
     def _find_player(self) -> tuple:
         """Find available media player. Returns (player_path, player_name)."""
-        # Check for mpv
-        mpv_paths = [
-            r'C:\Program Files\mpv\mpv.exe',
-            r'C:\Program Files (x86)\mpv\mpv.exe',
-            'mpv'  # In PATH
-        ]
-        for path in mpv_paths:
-            if Path(path).exists() or self._is_in_path('mpv'):
-                return (path if Path(path).exists() else 'mpv', 'mpv')
-
-        # Check for VLC
-        vlc_paths = [
-            r'C:\Program Files\VideoLAN\VLC\vlc.exe',
-            r'C:\Program Files (x86)\VideoLAN\VLC\vlc.exe',
-            'vlc'
-        ]
-        for path in vlc_paths:
-            if Path(path).exists() or self._is_in_path('vlc'):
-                return (path if Path(path).exists() else 'vlc', 'vlc')
-
-        # Fallback to system default
-        return ('default', 'default')
+        return _discover_player()
 
     def _is_in_path(self, cmd: str) -> bool:
         """Check if command is in system PATH."""
-        try:
-            subprocess.run([cmd, '--version'], capture_output=True, timeout=5)
-            return True
-        except:
-            return False
+        return shutil.which(cmd) is not None
 
     def play(self, file_path: str) -> dict:
         """Play a local media file."""
@@ -344,6 +451,34 @@ class LocalMediaPlayer:
 # YOUTUBE PLAYBACK
 # ================================================================
 
+# yt-dlp Python API, imported on first search (it is a heavy import) and
+# shared so its extractor setup and HTTP session are reused across queries
+_YDL = None  # False once the import has failed
+_YDL_LOCK = threading.Lock()
+
+
+def _get_ydl():
+    """Return the shared YoutubeDL instance, or None if yt_dlp isn't installed."""
+    global _YDL
+    if _YDL is False:
+        return None
+    if _YDL is None:
+        try:
+            from yt_dlp import YoutubeDL
+        except ImportError:
+            _YDL = False
+            return None
+        with _YDL_LOCK:
+            if _YDL is None:
+                _YDL = YoutubeDL({
+                    'quiet': True,
+                    'no_warnings': True,
+                    'skip_download': True,
+                    'extract_flat': 'in_playlist',
+                })
+    return _YDL
+
+
 class YouTubePlayer:
     """Play YouTube videos/audio."""
 
@@ -353,6 +488,10 @@ class YouTubePlayer:
         r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]{11})',
         r'(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})',
     ]
+    # All of YT_PATTERNS fused, so classifying and extracting take one match
+    _YT_RE = re.compile(
+        r'(?:https?://)?(?:www\.)?(?:youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/)([a-zA-Z0-9_-]{11})'
+    )
 
     def __init__(self, method: str = 'browser'):
         """
@@ -364,25 +503,19 @@ class YouTubePlayer:
 
     def is_youtube_url(self, url: str) -> bool:
         """Check if URL is a YouTube link."""
-        for pattern in self.YT_PATTERNS:
-            if re.match(pattern, url):
-                return True
-        return False
+        return self._YT_RE.match(url) is not None
 
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        for pattern in self.YT_PATTERNS:
-            match = re.match(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = self._YT_RE.match(url)
+        return match.group(1) if match else None
 
     def play(self, url: str, audio_only: bool = False) -> dict:
         """Play a YouTube video."""
-        if not self.is_youtube_url(url):
+        video_id = self.extract_video_id(url)
+        if video_id is None:
             return {'success': False, 'error': 'Not a valid YouTube URL'}
 
-        video_id = self.extract_video_id(url)
         clean_url = f'https://www.youtube.com/watch?v={video_id}'
 
         if self.method == 'browser':
@@ -463,23 +596,50 @@ class YouTubePlayer:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
-    def search_and_play(self, query: str, audio_only: bool = False) -> dict:
-        """Search YouTube and play first result (requires yt-dlp)."""
-        try:
-            # Use yt-dlp to search
-            result = subprocess.run(
-                ['yt-dlp', '--get-id', f'ytsearch1:{query}'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+    def search(self, query: str) -> Optional[str]:
+        """
+        Find the first YouTube result for a query without playing it.
 
-            if result.returncode == 0 and result.stdout.strip():
-                video_id = result.stdout.strip()
-                url = f'https://www.youtube.com/watch?v={video_id}'
-                return self.play(url, audio_only)
-            else:
+        Returns:
+            Watch URL of the first result, or None if nothing matched
+
+        Raises:
+            FileNotFoundError: If neither yt_dlp nor the yt-dlp tool is installed
+        """
+        ydl = _get_ydl()
+        if ydl is not None:
+            # In-process search: no yt-dlp process start per query
+            with _YDL_LOCK:
+                info = ydl.extract_info(f'ytsearch1:{query}', download=False)
+            entries = (info or {}).get('entries') or []
+            return f'https://www.youtube.com/watch?v={entries[0]["id"]}' if entries else None
+
+        # Use the yt-dlp command-line tool to search
+        result = subprocess.run(
+            ['yt-dlp', '--get-id', f'ytsearch1:{query}'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        video_id = result.stdout.strip()
+        if result.returncode == 0 and video_id:
+            return f'https://www.youtube.com/watch?v={video_id}'
+        return None
+
+    def search_and_play(self, query: str, audio_only: bool = False, pending=None) -> dict:
+        """
+        Search YouTube and play first result (requires yt-dlp).
+
+        Args:
+            query: Search terms
+            audio_only: Play audio only (mpv)
+            pending: Optional Future already running self.search(query)
+        """
+        try:
+            url = pending.result() if pending is not None else self.search(query)
+            if url is None:
                 return {'success': False, 'error': f'No results for: {query}'}
+            return self.play(url, audio_only)
 
         except FileNotFoundError:
             # Fallback: open YouTube search in browser
@@ -498,6 +658,16 @@ class YouTubePlayer:
 # EMBY MEDIA SERVER (Optional)
 # ================================================================
 
+# Emby controllers with open HTTP sessions, closed at interpreter exit
+_open_emby = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all_emby():
+    for emby in list(_open_emby):
+        emby.close()
+
+
 class EmbyControl:
     """Control Emby media server - play, pause, search, etc."""
 
@@ -512,6 +682,77 @@ class EmbyControl:
         self.base_url = f"http://{server}:{port}/emby" if server else ''
         self.headers = {'X-Emby-Token': self.api_key} if self.api_key else {}
         self.configured = bool(server and self.api_key)
+        self._session = None
+        self._user_id: Optional[str] = None
+        self._sessions_cache: Dict[bool, tuple] = {}  # controllable_only -> (fetched at, sessions)
+        self._alive_ok = True
+        self._alive_until = 0.0
+
+        # Fixed endpoints, built once
+        self._users_url = f"{self.base_url}/Users"
+        self._info_url = f"{self.base_url}/System/Info/Public"
+        self._sessions_url = f"{self.base_url[:-len('/emby')]}/Sessions" if server else ''
+
+    def _http(self):
+        """Return the keep-alive HTTP session for this server (created on first use)."""
+        if self._session is None:
+            if not REQUESTS_AVAILABLE:
+                raise ImportError("requests is required for Emby control (pip install requests)")
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.trust_env = False  # LAN server: skip proxy/netrc lookups per request
+            # Read/status retries only for GET/HEAD; a POST is only retried if it never connected
+            retry = Retry(total=2, connect=2, read=1, backoff_factor=0.15,
+                          status_forcelist=(502, 503, 504), allowed_methods=frozenset(['GET', 'HEAD']),
+                          raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+            _open_emby.add(self)
+        return self._session
+
+    # Emby answers with small JSON bodies or 204s and never redirects
+    TIMEOUT = (2, 8)  # (connect, read) seconds
+
+    def _get(self, url: str, **kwargs):
+        """GET from the Emby server with the shared timeout policy."""
+        return self._http().get(url, timeout=self.TIMEOUT, allow_redirects=False, **kwargs)
+
+    def _post(self, url: str, **kwargs):
+        """POST to the Emby server with the shared timeout policy."""
+        return self._http().post(url, timeout=self.TIMEOUT, allow_redirects=False, **kwargs)
+
+    def close(self):
+        """Close pooled connections to the Emby server."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    ALIVE_TTL = 30.0  # seconds to trust a reachable server
+    DEAD_TTL = 10.0   # seconds to skip an unreachable one
+
+    def _is_alive(self) -> bool:
+        """Cheap, cached reachability probe so a down server fails fast."""
+        now = time.monotonic()
+        if now >= self._alive_until:
+            try:
+                # Any HTTP answer means the server is up. A one-off session
+                # without the pooled adapter's retries, so a down server
+                # costs one connection attempt
+                with requests.Session() as probe:
+                    probe.trust_env = False
+                    probe.head(self._info_url, headers=self.headers, timeout=(1, 2), allow_redirects=False)
+                self._alive_ok = True
+            except Exception:
+                self._alive_ok = False
+            self._alive_until = now + (self.ALIVE_TTL if self._alive_ok else self.DEAD_TTL)
+        return self._alive_ok
+
+    def _playing_url(self, session_id: str, command: str = '') -> str:
+        """URL for a session's Playing endpoint, optionally with a command."""
+        url = self._sessions_url + '/' + session_id + '/Playing'
+        return url + '/' + command if command else url
 
     def _check_configured(self) -> dict:
         """Check if Emby is configured."""
@@ -521,66 +762,107 @@ class EmbyControl:
                 'error': 'Emby not configured',
                 'hint': f'Create {MEDIA_CONFIG_FILE} with emby_server, emby_port, emby_api_key'
             }
+        if not self._is_alive():
+            return {'success': False, 'error': 'Emby server unreachable'}
         return None
 
-    def get_sessions(self) -> List[dict]:
-        """Get active Emby sessions."""
+    SESSIONS_TTL = 2.0  # seconds a /Sessions listing is reused
+
+    def get_sessions(self, controllable_only: bool = False) -> List[dict]:
+        """Get active Emby sessions (cached for SESSIONS_TTL seconds).
+
+        Args:
+            controllable_only: Let the server return only sessions the user can control
+        """
         if not self.configured:
             return []
+        now = time.monotonic()
+        fetched_at, sessions = self._sessions_cache.get(controllable_only, (0.0, []))
+        if now - fetched_at < self.SESSIONS_TTL:
+            return sessions
+        if not self._is_alive():
+            return []
+        params = None
+        if controllable_only:
+            user_id = self.get_user_id()
+            if user_id:
+                params = {'ControllableByUserId': user_id}
         try:
-            import requests
-            response = requests.get(
-                f"{self.base_url}/../Sessions",
-                headers=self.headers,
-                timeout=10
-            )
+            response = self._get(self._sessions_url, params=params)
             if response.status_code == 200:
-                return response.json()
+                sessions = _json_loads(response.content)
+                self._sessions_cache[controllable_only] = (now, sessions)
+                return sessions
         except Exception as e:
-            print(f"[EMBY] Error getting sessions: {e}")
+            log.debug("Emby: error getting sessions: %s", e)
         return []
 
+    def invalidate_sessions(self):
+        """Drop the cached session list so the next lookup sees fresh state."""
+        self._sessions_cache.clear()
+
     def get_controllable_session(self) -> tuple:
         """Find a session that supports remote control."""
-        sessions = self.get_sessions()
+        # Server-side filtered; the flag check still covers the unfiltered fallback
+        sessions = self.get_sessions(controllable_only=True)
         for session in sessions:
             if session.get('SupportsRemoteControl', False):
                 return session['Id'], session.get('DeviceName', 'Unknown')
         return None, None
 
-    def search(self, query: str, media_type: str = None, limit: int = 10) -> List[dict]:
-        """Search Emby library."""
+    def get_user_id(self) -> Optional[str]:
+        """Get the Emby user ID to query as (the first user; looked up once)."""
+        if self._user_id is None and self.configured and self._is_alive():
+            try:
+                resp = self._get(self._users_url)
+                if resp.status_code == 200:
+                    users = _json_loads(resp.content)
+                    self._user_id = users[0]['Id'] if users else None
+            except Exception as e:
+                log.debug("Emby: error getting user: %s", e)
+        return self._user_id
+
+    def search(self, query: str, media_type: str = None, limit: int = 10,
+               detailed: bool = True) -> List[dict]:
+        """Search Emby library.
+
+        Args:
+            query: Search term
+            media_type: Optional IncludeItemTypes filter (e.g. 'Audio', 'Movie')
+            limit: Maximum number of items
+            detailed: Also fetch image/overview fields (for display); the
+                play path only needs Id and Name
+        """
         err = self._check_configured()
         if err:
             return []
 
         try:
-            import requests
-            # Get user ID first
-            resp = requests.get(f"{self.base_url}/Users", headers=self.headers, timeout=10)
-            if resp.status_code != 200:
-                return []
-            users = resp.json()
-            user_id = users[0]['Id'] if users else None
+            user_id = self.get_user_id()
             if not user_id:
                 return []
 
-            url = f"{self.base_url}/Users/{user_id}/Items"
+            url = f"{self._users_url}/{user_id}/Items"
             params = {
                 'SearchTerm': query,
                 'Recursive': 'true',
                 'Limit': limit,
-                'Fields': 'PrimaryImageAspectRatio,Overview',
+                'EnableTotalRecordCount': 'false',  # skip the server-side COUNT
                 'api_key': self.api_key
             }
+            if detailed:
+                params['Fields'] = 'PrimaryImageAspectRatio,Overview'
             if media_type:
                 params['IncludeItemTypes'] = media_type
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get(url, params=params)
             if response.status_code == 200:
-                return response.json().get('Items', [])
+                return _json_loads(response.content).get('Items', [])
+            if response.status_code in (401, 403, 404):
+                self._user_id = None  # Key or user changed; look it up again
+
         except Exception as e:
-            print(f"[EMBY] Search error: {e}")
+            log.debug("Emby: search error: %s", e)
         return []
 
     def play(self, item_id: str) -> dict:
@@ -594,12 +876,12 @@ class EmbyControl:
             return {'success': False, 'error': 'No controllable Emby session found'}
 
         try:
-            import requests
-            url = f"{self.base_url}/../Sessions/{session_id}/Playing"
+            url = self._playing_url(session_id)
             data = {'ItemIds': item_id, 'PlayCommand': 'PlayNow'}
-            response = requests.post(url, headers=self.headers, json=data, timeout=10)
+            response = self._post(url, json=data)
 
             if response.status_code == 204:
+                self.invalidate_sessions()
                 return {'success': True, 'message': f'Playing on {device}'}
             return {'success': False, 'error': f'HTTP {response.status_code}'}
         except Exception as e:
@@ -616,11 +898,11 @@ class EmbyControl:
             return {'success': False, 'error': 'No controllable session'}
 
         try:
-            import requests
-            url = f"{self.base_url}/../Sessions/{session_id}/Playing/{command}"
-            response = requests.post(url, headers=self.headers, timeout=10)
+            url = self._playing_url(session_id, command)
+            response = self._post(url)
 
             if response.status_code == 204:
+                self.invalidate_sessions()
                 return {'success': True, 'message': f'{command} on {device}'}
             return {'success': False, 'error': f'HTTP {response.status_code}'}
         except Exception as e:
@@ -631,20 +913,19 @@ class EmbyControl:
         if not self.configured:
             return "Emby not configured"
 
-        sessions = self.get_sessions()
-        for session in sessions:
-            if session.get('NowPlayingItem'):
-                item = session['NowPlayingItem']
-                name = item.get('Name', 'Unknown')
-                item_type = item.get('Type', '')
-                artist = item.get('Artists', [''])[0] if item.get('Artists') else ''
-                is_paused = session.get('PlayState', {}).get('IsPaused', False)
-                status = "Paused" if is_paused else "Playing"
-
-                if artist:
-                    return f"{status}: {artist} - {name}"
-                return f"{status}: {name} ({item_type})"
-        return "Nothing playing"
+        session = next((s for s in self.get_sessions() if s.get('NowPlayingItem')), None)
+        if session is None:
+            return "Nothing playing"
+
+        item = session['NowPlayingItem']
+        name = item.get('Name', 'Unknown')
+        artists = item.get('Artists')
+        is_paused = session.get('PlayState', {}).get('IsPaused', False)
+        status = "Paused" if is_paused else "Playing"
+
+        if artists:
+            return f"{status}: {artists[0]} - {name}"
+        return f"{status}: {name} ({item.get('Type', '')})"
 
     def pause(self) -> dict:
         return self.control('Pause')
@@ -677,15 +958,54 @@ class MediaController:
     4. System media keys -> SystemMediaControl
     """
 
+    # Seconds Emby gets to answer a search before YouTube is searched alongside it
+    EMBY_HEDGE_DELAY = 0.5
+
     def __init__(self, config: dict = None):
         if config is None:
             config = load_media_config()
 
         self.config = config
-        self.system = SystemMediaControl()
-        self.local = LocalMediaPlayer(config.get('local_player', 'default'))
-        self.youtube = YouTubePlayer(config.get('youtube_method', 'browser'))
-        self.emby = EmbyControl(config)
+
+        # Last Emby verdict, so repeated misses skip straight to media keys
+        self._emby_has_controllable = False
+        self._emby_controllable_until = 0.0
+
+    # Backends are built on first use, so e.g. volume control never probes for players
+
+    @cached_property
+    def system(self) -> SystemMediaControl:
+        return SystemMediaControl()
+
+    @cached_property
+    def local(self) -> LocalMediaPlayer:
+        return LocalMediaPlayer(self.config.get('local_player', 'default'))
+
+    @cached_property
+    def youtube(self) -> YouTubePlayer:
+        return YouTubePlayer(self.config.get('youtube_method', 'browser'))
+
+    @cached_property
+    def emby(self) -> EmbyControl:
+        return EmbyControl(self.config)
+
+    EMBY_HIT_TTL = 5.0    # seconds to trust a controllable session
+    EMBY_MISS_TTL = 30.0  # seconds to skip Emby after it had nothing to control
+
+    def _emby_or_system(self, emby_action, system_action) -> dict:
+        """Run an Emby control, falling back to a system media key."""
+        if not self.emby.configured:
+            return system_action()
+        now = time.monotonic()
+        if now < self._emby_controllable_until and not self._emby_has_controllable:
+            return system_action()
+
+        result = emby_action()
+        self._emby_has_controllable = result['success']
+        self._emby_controllable_until = now + (self.EMBY_HIT_TTL if result['success'] else self.EMBY_MISS_TTL)
+        if result['success']:
+            return result
+        return system_action()
 
     def play(self, target: str = None) -> dict:
         """
@@ -705,37 +1025,43 @@ class MediaController:
         if self.youtube.is_youtube_url(target):
             return self.youtube.play(target)
 
-        # Check if it's a local file
-        if Path(target).exists():
-            return self.local.play(target)
-
-        # Check if it looks like a file path but doesn't exist
-        if '\\' in target or '/' in target or target.endswith(tuple(MEDIA_EXTENSIONS)):
+        # Only path-like input is worth a filesystem check
+        if '\\' in target or '/' in target or _MEDIA_EXT_RE.search(target):
+            if Path(target).exists():
+                return self.local.play(target)
             return {'success': False, 'error': f'File not found: {target}'}
 
         # It's a search query - try Emby first if configured, then YouTube
-        if self.emby.configured:
-            results = self.emby.search(target)
-            if results:
-                item = results[0]
-                result = self.emby.play(item['Id'])
-                if result['success']:
-                    result['source'] = 'emby'
-                    result['title'] = item.get('Name', 'Unknown')
-                    return result
-
-        # Search YouTube
-        return self.youtube.search_and_play(target)
+        if not self.emby.configured:
+            return self.youtube.search_and_play(target)
+
+        # List Emby sessions while Emby is searched. A running yt-dlp search
+        # can't be cancelled, so YouTube is only searched once Emby misses, or
+        # alongside a slow Emby so a miss costs max(emby, youtube), not the sum
+        prefetch = _executor.submit(self.emby.get_controllable_session)
+        emby_search = _executor.submit(self.emby.search, target, limit=1, detailed=False)
+        yt_search = None
+        try:
+            results = emby_search.result(timeout=self.EMBY_HEDGE_DELAY)
+        except FutureTimeout:
+            yt_search = _executor.submit(self.youtube.search, target)
+            results = emby_search.result()
+        if results:
+            prefetch.result()  # emby.play() then hits the session cache
+            item = results[0]
+            result = self.emby.play(item['Id'])
+            if result['success']:
+                if yt_search is not None:
+                    yt_search.cancel()  # Only helps while it is still queued
+                result['source'] = 'emby'
+                result['title'] = item.get('Name', 'Unknown')
+                return result
+
+        return self.youtube.search_and_play(target, pending=yt_search)
 
     def pause(self) -> dict:
         """Pause playback."""
-        # Try Emby first if configured
-        if self.emby.configured:
-            result = self.emby.pause()
-            if result['success']:
-                return result
-        # Fall back to system media keys
-        return self.system.pause()
+        return self._emby_or_system(self.emby.pause, self.system.pause)
 
     def resume(self) -> dict:
         """Resume playback."""
@@ -743,27 +1069,15 @@ class MediaController:
 
     def stop(self) -> dict:
         """Stop playback."""
-        if self.emby.configured:
-            result = self.emby.stop()
-            if result['success']:
-                return result
-        return self.system.stop()
+        return self._emby_or_system(self.emby.stop, self.system.stop)
 
     def next_track(self) -> dict:
         """Next track."""
-        if self.emby.configured:
-            result = self.emby.next_track()
-            if result['success']:
-                return result
-        return self.system.next_track()
+        return self._emby_or_system(self.emby.next_track, self.system.next_track)
 
     def prev_track(self) -> dict:
         """Previous track."""
-        if self.emby.configured:
-            result = self.emby.prev_track()
-            if result['success']:
-                return result
-        return self.system.prev_track()
+        return self._emby_or_system(self.emby.prev_track, self.system.prev_track)
 
     def volume_up(self) -> dict:
         """Volume up."""
@@ -10,13 +10,15 @@ Per ARCHITECTURE.md v1.0.0:
 - Configurable save location (default: Desktop)
 """
 
+import io
 import os
 import sys
 import json
+import time
 import base64
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict, Any, Iterator
 from dataclasses import dataclass
 
 # Optional imports
@@ -38,6 +40,13 @@ try:
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
 
+# SIMD base64 encoder for large captures
+try:
+    import pybase64
+    _b64encode = pybase64.b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+
 
 # Project paths
 PROJECT_DIR = Path(__file__).parent.parent
@@ -48,6 +57,32 @@ SETTINGS_FILE = CONFIG_DIR / 'settings.json'
 DEFAULT_SCREENSHOT_DIR = Path.home() / 'Desktop' / 'CORA_Screenshots'
 
 
+# Parsed settings.json, keyed by (mtime_ns, size) so edits by other tools are picked up
+_SETTINGS_CACHE: Dict[str, Any] = {}
+
+
+def _load_settings() -> dict:
+    """Load config/settings.json, reusing the parsed copy while the file is unchanged.
+
+    Returns:
+        Settings dict (shared; copy before modifying), empty if the file is missing
+
+    Raises:
+        ValueError: If the file is not valid JSON (left uncached)
+    """
+    try:
+        st = os.stat(SETTINGS_FILE)
+    except OSError:
+        return {}
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _SETTINGS_CACHE.get('key') != key:
+        config = json.loads(SETTINGS_FILE.read_bytes())
+        _SETTINGS_CACHE['key'] = key
+        _SETTINGS_CACHE['val'] = config
+    return _SETTINGS_CACHE['val']
+
+
 def get_screenshot_dir() -> Path:
     """Get the configured screenshot directory.
 
@@ -58,15 +93,12 @@ def get_screenshot_dir() -> Path:
         Path to screenshot directory
     """
     # Try to read from settings
-    if SETTINGS_FILE.exists():
-        try:
-            with open(SETTINGS_FILE) as f:
-                config = json.load(f)
-            screenshot_path = config.get('screenshots', {}).get('directory')
-            if screenshot_path:
-                return Path(screenshot_path)
-        except Exception:
-            pass
+    try:
+        screenshot_path = _load_settings().get('screenshots', {}).get('directory')
+        if screenshot_path:
+            return Path(screenshot_path)
+    except Exception:
+        pass
 
     return DEFAULT_SCREENSHOT_DIR
 
@@ -75,6 +107,34 @@ def get_screenshot_dir() -> Path:
 SCREENSHOT_DIR = get_screenshot_dir()
 
 
+# zlib level for saved PNGs: level 1 is several times faster than Pillow's
+# default 6 and still lossless, at the cost of somewhat larger files
+PNG_COMPRESS_LEVEL = 1
+
+
+def _save_image(image, save_path: Path, return_base64: bool = False) -> Optional[str]:
+    """Save a captured image, optionally returning its base64 encoding.
+
+    With return_base64 the image is encoded once in memory, then written and
+    base64-encoded from the same buffer instead of re-reading the saved file.
+
+    Returns:
+        Base64 string if requested, else None
+    """
+    fmt = Image.registered_extensions().get(save_path.suffix.lower(), 'PNG')
+    options = {'compress_level': PNG_COMPRESS_LEVEL} if fmt == 'PNG' else {}
+
+    if not return_base64:
+        image.save(str(save_path), **options)
+        return None
+
+    buf = io.BytesIO()
+    image.save(buf, format=fmt, **options)
+    data = buf.getvalue()
+    save_path.write_bytes(data)
+    return image_bytes_to_base64(data)
+
+
 @dataclass
 class ScreenshotResult:
     """Result of screenshot operation."""
@@ -120,20 +180,17 @@ def desktop(
         save_path = (save_dir or SCREENSHOT_DIR) / filename
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save image
-        screenshot.save(str(save_path))
+        # Save image (and optionally encode to base64 from the same buffer)
+        encoded = _save_image(screenshot, save_path, return_base64)
 
         result = ScreenshotResult(
             success=True,
             path=save_path,
+            base64=encoded,
             width=screenshot.width,
             height=screenshot.height
         )
 
-        # Optionally encode to base64
-        if return_base64:
-            result.base64 = image_to_base64(save_path)
-
         # Note: Don't auto-show modal here - let caller decide whether to display
         # This prevents double popups when boot_sequence also shows the image
 
@@ -205,18 +262,16 @@ def window(
         # Save
         save_path = (save_dir or SCREENSHOT_DIR) / filename
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        screenshot.save(str(save_path))
+        encoded = _save_image(screenshot, save_path, return_base64)
 
         result = ScreenshotResult(
             success=True,
             path=save_path,
+            base64=encoded,
             width=screenshot.width,
             height=screenshot.height
         )
 
-        if return_base64:
-            result.base64 = image_to_base64(save_path)
-
         return result
 
     except Exception as e:
@@ -251,7 +306,7 @@ def region(
 
         save_path = (save_dir or SCREENSHOT_DIR) / filename
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        screenshot.save(str(save_path))
+        _save_image(screenshot, save_path)
 
         return ScreenshotResult(
             success=True,
@@ -264,19 +319,80 @@ def region(
         return ScreenshotResult(success=False, error=str(e))
 
 
+# Window titles from the last enumeration: (monotonic time, titles)
+_WINDOW_TITLES_TTL = 0.5
+_window_titles_cache = (float('-inf'), [])
+
+
+def _win32_window_titles() -> List[str]:
+    """Titles of visible top-level windows via EnumWindows (Windows only).
+
+    Windows with an empty title are skipped before any text buffer is made.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    titles = []  # Filled by the callback; LPARAM is unused
+
+    def enum_callback(hwnd, _lparam):
+        if user32.IsWindowVisible(hwnd):
+            length = user32.GetWindowTextLengthW(hwnd)
+            if length:
+                title = ctypes.create_unicode_buffer(length + 1)
+                user32.GetWindowTextW(hwnd, title, length + 1)
+                if title.value:
+                    titles.append(title.value)
+        return True
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
+    user32.EnumWindows(WNDENUMPROC(enum_callback), 0)
+    return titles
+
+
 def list_windows() -> List[str]:
     """Get list of all window titles.
 
+    Repeated calls within half a second reuse the previous enumeration.
+
     Returns:
         List of window titles
     """
-    if not GW_AVAILABLE:
-        return []
+    global _window_titles_cache
 
-    try:
-        return [w.title for w in gw.getAllWindows() if w.title]
-    except Exception:
-        return []
+    now = time.monotonic()
+    stamp, titles = _window_titles_cache
+    if now - stamp < _WINDOW_TITLES_TTL:
+        return list(titles)
+
+    titles = None
+    if sys.platform == 'win32':
+        try:
+            titles = _win32_window_titles()
+        except Exception:
+            pass  # Fall back to pygetwindow
+    if titles is None:
+        if not GW_AVAILABLE:
+            return []
+        try:
+            titles = [w.title for w in gw.getAllWindows() if w.title]
+        except Exception:
+            return []
+
+    _window_titles_cache = (now, titles)
+    return list(titles)
+
+
+def image_bytes_to_base64(data: bytes) -> str:
+    """Convert encoded image bytes (e.g. PNG) to a base64 string.
+
+    Args:
+        data: Image file contents
+
+    Returns:
+        Base64 encoded string
+    """
+    return _b64encode(data).decode('ascii')
 
 
 def image_to_base64(image_path: Path) -> Optional[str]:
@@ -289,12 +405,34 @@ def image_to_base64(image_path: Path) -> Optional[str]:
         Base64 encoded string or None
     """
     try:
-        with open(image_path, 'rb') as f:
-            return base64.b64encode(f.read()).decode('utf-8')
+        return image_bytes_to_base64(Path(image_path).read_bytes())
     except Exception:
         return None
 
 
+def iter_image_base64(image_path: Path, chunk_size: int = 48 * 1024) -> Iterator[str]:
+    """Base64-encode an image file piece by piece.
+
+    For senders that can consume the encoding incrementally (e.g. a socket),
+    so neither the whole file nor the whole encoding is held in memory.
+    Concatenating the chunks gives the same string as image_to_base64.
+
+    Args:
+        image_path: Path to image
+        chunk_size: Bytes read per chunk (rounded down to a multiple of 3)
+
+    Yields:
+        Base64 text chunks
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)  # no padding mid-stream
+    with open(image_path, 'rb') as f:
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            yield _b64encode(block).decode('ascii')
+
+
 def get_screen_size() -> tuple:
     """Get screen dimensions.
 
@@ -303,7 +441,27 @@ def get_screen_size() -> tuple:
     """
     if PYAUTOGUI_AVAILABLE:
         return pyautogui.size()
-    elif PIL_AVAILABLE:
+
+    # Ask the platform before falling back to capturing the whole screen.
+    # Plain C calls only: commands run on worker threads, where Tk is off-limits
+    try:
+        import ctypes
+        if sys.platform == 'win32':
+            user32 = ctypes.windll.user32
+            return (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+        if sys.platform == 'darwin':
+            quartz = ctypes.CDLL('/System/Library/Frameworks/CoreGraphics.framework/CoreGraphics')
+            quartz.CGMainDisplayID.restype = ctypes.c_uint32
+            quartz.CGDisplayPixelsWide.argtypes = [ctypes.c_uint32]
+            quartz.CGDisplayPixelsWide.restype = ctypes.c_size_t
+            quartz.CGDisplayPixelsHigh.argtypes = [ctypes.c_uint32]
+            quartz.CGDisplayPixelsHigh.restype = ctypes.c_size_t
+            display = quartz.CGMainDisplayID()
+            return (quartz.CGDisplayPixelsWide(display), quartz.CGDisplayPixelsHigh(display))
+    except Exception:
+        pass
+
+    if PIL_AVAILABLE:
         img = ImageGrab.grab()
         return (img.width, img.height)
     return (0, 0)
@@ -340,18 +498,15 @@ def set_screenshot_dir(new_dir: Union[str, Path]) -> bool:
 
     # Update settings file
     try:
-        config = {}
-        if SETTINGS_FILE.exists():
-            with open(SETTINGS_FILE) as f:
-                config = json.load(f)
-
-        if 'screenshots' not in config:
-            config['screenshots'] = {}
-        config['screenshots']['directory'] = str(new_path)
+        config = dict(_load_settings())
+        config['screenshots'] = {**config.get('screenshots', {}), 'directory': str(new_path)}
 
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         with open(SETTINGS_FILE, 'w') as f:
             json.dump(config, f, indent=2)
+        st = os.stat(SETTINGS_FILE)
+        _SETTINGS_CACHE['key'] = (st.st_mtime_ns, st.st_size)
+        _SETTINGS_CACHE['val'] = config
 
         SCREENSHOT_DIR = new_path
         return True
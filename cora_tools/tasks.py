@@ -14,18 +14,65 @@ Per ARCHITECTURE.md v1.0.0:
 - search_tasks(query)
 """
 
+import os
 import json
-from datetime import datetime, timedelta
+import atexit
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Project paths
 PROJECT_DIR = Path(__file__).parent.parent
 TASKS_FILE = PROJECT_DIR / 'data' / 'tasks.json'
 
+# Managers with possibly unsaved changes, flushed at interpreter exit
+_live_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for manager in list(_live_managers):
+        manager.flush()
+
+
+@lru_cache(maxsize=1024)
+def _due_date(due: str) -> Optional[date]:
+    """Parse a task's due string once; None if it isn't an ISO date."""
+    try:
+        return datetime.fromisoformat(due).date()
+    except ValueError:
+        return None
+
+
+def _id_number(task_id: Optional[str]) -> int:
+    """Numeric part of a task ID like T012, or -1 if it has none."""
+    if task_id and task_id.startswith('T'):
+        try:
+            return int(task_id[1:])
+        except ValueError:
+            pass
+    return -1
+
 
 class TaskManager:
-    """Manages tasks for CORA."""
+    """Manages tasks for CORA.
+
+    Mutations mark the manager dirty and tasks.json is rewritten once,
+    SAVE_DELAY seconds after the last burst of changes (or at exit, on
+    flush(), or when a batch() block ends).
+    """
+
+    SAVE_DELAY = 0.25
 
     def __init__(self, data_file: Optional[Path] = None):
         """Initialize task manager.
@@ -35,8 +82,16 @@ class TaskManager:
         """
         self.data_file = data_file or TASKS_FILE
         self.tasks: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}  # id -> task, kept in sync with self.tasks
+        self._search_text: Dict[int, tuple] = {}  # id(task) -> (task, text, notes, lowercased blob)
         self._counter = 0
 
+        self._dirty = False
+        self._batch_depth = 0
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        _live_managers.add(self)
+
         self.load()
 
     def load(self) -> bool:
@@ -45,28 +100,36 @@ class TaskManager:
         Returns:
             True if loaded successfully
         """
+        self.flush()  # don't drop changes still waiting to be saved
         try:
-            if self.data_file.exists():
-                with open(self.data_file) as f:
-                    data = json.load(f)
-                    self.tasks = data.get('tasks', [])
-                    self._counter = data.get('counter', 0)
-
-                    # Update counter from existing tasks
-                    for t in self.tasks:
-                        tid = t.get('id', '')
-                        if tid.startswith('T'):
-                            try:
-                                num = int(tid[1:])
-                                if num >= self._counter:
-                                    self._counter = num + 1
-                            except ValueError:
-                                pass
-                    return True
+            raw = self.data_file.read_bytes()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"[!] Failed to load tasks: {e}")
+            return False
+
+        try:
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            self.tasks = data.get('tasks', [])
+            self._counter = data.get('counter', 0)
+            self._search_text = {}
+            self._reindex()
+
+            # Update counter from existing tasks
+            highest = max((_id_number(tid) for tid in self._by_id), default=-1)
+            self._counter = max(self._counter, highest + 1)
+            return True
         except Exception as e:
             print(f"[!] Failed to load tasks: {e}")
         return False
 
+    def _reindex(self):
+        """Rebuild the id lookup (first task wins if ids repeat)."""
+        self._by_id = {}
+        for t in self.tasks:
+            self._by_id.setdefault(t.get('id'), t)
+
     def save(self) -> bool:
         """Save tasks to file.
 
@@ -79,13 +142,66 @@ class TaskManager:
                 'counter': self._counter,
                 'tasks': self.tasks
             }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            payload = None
+            if ORJSON_AVAILABLE:
+                try:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                except TypeError:
+                    pass  # Something orjson won't encode; use json below
+                # orjson writes raw UTF-8; readers open the file with the
+                # platform encoding, so non-ASCII text goes through json's escapes
+                if payload is not None and not payload.isascii():
+                    payload = None
+            if payload is None:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+
+            # Write beside the file and swap it in, so a crash never truncates it
+            tmp = self.data_file.with_name(self.data_file.name + '.tmp')
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.data_file)
             return True
         except Exception as e:
             print(f"[!] Failed to save tasks: {e}")
             return False
 
+    def _mark_dirty(self):
+        """Schedule a save for the current burst of changes."""
+        with self._save_lock:
+            self._dirty = True
+            if self._batch_depth or self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes to disk now.
+
+        Returns:
+            True if saved (or nothing was pending)
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = not self.save()
+            return not self._dirty
+
+    @contextmanager
+    def batch(self):
+        """Group many changes into a single save at the end of the block."""
+        with self._save_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
     def _get_next_id(self) -> str:
         """Generate the next task ID.
 
@@ -134,7 +250,8 @@ class TaskManager:
             })
 
         self.tasks.append(task)
-        self.save()
+        self._by_id.setdefault(task_id, task)
+        self._mark_dirty()
         return task_id
 
     def list_tasks(self, filter_type: str = 'all') -> List[Dict[str, Any]]:
@@ -146,8 +263,7 @@ class TaskManager:
         Returns:
             List of task dicts
         """
-        now = datetime.now()
-        today = now.date()
+        today = datetime.now().date()
 
         if filter_type == 'all':
             return self.tasks
@@ -158,16 +274,11 @@ class TaskManager:
         elif filter_type == 'overdue':
             overdue = []
             for t in self.tasks:
-                if t.get('status') != 'pending':
-                    continue
                 due = t.get('due')
-                if due:
-                    try:
-                        due_date = datetime.fromisoformat(due).date()
-                        if due_date < today:
-                            overdue.append(t)
-                    except ValueError:
-                        pass
+                if due and t.get('status') == 'pending':
+                    due_date = _due_date(due)
+                    if due_date is not None and due_date < today:
+                        overdue.append(t)
             return overdue
         else:
             return self.tasks
@@ -181,11 +292,7 @@ class TaskManager:
         Returns:
             Task dict or None
         """
-        task_id = task_id.upper()
-        for t in self.tasks:
-            if t.get('id') == task_id:
-                return t
-        return None
+        return self._by_id.get(task_id.upper())
 
     def complete_task(self, task_id: str) -> bool:
         """Mark a task as completed.
@@ -200,7 +307,7 @@ class TaskManager:
         if task:
             task['status'] = 'done'
             task['completed'] = datetime.now().isoformat()
-            self.save()
+            self._mark_dirty()
             return True
         return False
 
@@ -213,13 +320,14 @@ class TaskManager:
         Returns:
             True if deleted successfully
         """
-        task_id = task_id.upper()
-        for i, t in enumerate(self.tasks):
-            if t.get('id') == task_id:
-                self.tasks.pop(i)
-                self.save()
-                return True
-        return False
+        task = self.get_task(task_id)
+        if task is None:
+            return False
+        self.tasks.remove(task)
+        self._search_text.pop(id(task), None)
+        self._reindex()  # a later task with a repeated id becomes visible
+        self._mark_dirty()
+        return True
 
     def set_priority(self, task_id: str, level: int) -> bool:
         """Set task priority.
@@ -235,7 +343,7 @@ class TaskManager:
         if task:
             task['priority'] = max(1, min(10, level))
             task['modified'] = datetime.now().isoformat()
-            self.save()
+            self._mark_dirty()
             return True
         return False
 
@@ -253,7 +361,7 @@ class TaskManager:
         if task:
             task['due'] = date
             task['modified'] = datetime.now().isoformat()
-            self.save()
+            self._mark_dirty()
             return True
         return False
 
@@ -275,7 +383,7 @@ class TaskManager:
                 'text': text,
                 'created': datetime.now().isoformat()
             })
-            self.save()
+            self._mark_dirty()
             return True
         return False
 
@@ -289,13 +397,21 @@ class TaskManager:
             List of matching tasks
         """
         query = query.lower()
-        results = []
-        for t in self.tasks:
-            text = t.get('text', '').lower()
-            notes_text = ' '.join(n.get('text', '') for n in t.get('notes', [])).lower()
-            if query in text or query in notes_text:
-                results.append(t)
-        return results
+        return [t for t in self.tasks if query in self._search_blob(t)]
+
+    def _search_blob(self, task: Dict[str, Any]) -> str:
+        """Lowercased text + notes of a task, rebuilt only when either changes."""
+        text = task.get('text', '')
+        notes = [n.get('text', '') for n in task.get('notes', [])]
+        cached = self._search_text.get(id(task))
+        # Identity check guards against a recycled id(); comparing the note
+        # texts themselves catches notes edited in place
+        if cached is not None and cached[0] is task and cached[1] == text and cached[2] == notes:
+            return cached[3]
+        # Newline separator so a query can't match across text and notes
+        blob = '\n'.join([text, *notes]).lower()
+        self._search_text[id(task)] = (task, text, notes, blob)
+        return blob
 
     def update_task(self, task_id: str, **kwargs) -> bool:
         """Update task fields.
@@ -313,7 +429,7 @@ class TaskManager:
                 if key in ('text', 'priority', 'due', 'status'):
                     task[key] = value
             task['modified'] = datetime.now().isoformat()
-            self.save()
+            self._mark_dirty()
             return True
         return False
 
@@ -323,20 +439,32 @@ class TaskManager:
         Returns:
             Dict with pending, done, overdue counts
         """
-        pending = len(self.list_tasks('pending'))
-        done = len(self.list_tasks('done'))
-        overdue = len(self.list_tasks('overdue'))
-        total = len(self.tasks)
+        # One pass instead of three filtered lists
+        pending = done = overdue = 0
+        today = datetime.now().date()
+        for t in self.tasks:
+            status = t.get('status')
+            if status == 'done':
+                done += 1
+            elif status == 'pending':
+                pending += 1
+                due = t.get('due')
+                if due:
+                    due_date = _due_date(due)
+                    if due_date is not None and due_date < today:
+                        overdue += 1
 
         return {
-            'total': total,
+            'total': len(self.tasks),
             'pending': pending,
             'done': done,
             'overdue': overdue
         }
 
 
-# Convenience functions for direct use
+# Convenience functions for direct use. These are one-shot calls and other
+# code (src/cora.py, ai/context.py) reads tasks.json directly, so mutating
+# wrappers save immediately instead of waiting for the debounce.
 
 _manager: Optional[TaskManager] = None
 
@@ -366,7 +494,10 @@ def add_task(
     Returns:
         Task ID (e.g., T001)
     """
-    return get_manager().add_task(text, priority, due_date, notes)
+    manager = get_manager()
+    task_id = manager.add_task(text, priority, due_date, notes)
+    manager.flush()
+    return task_id
 
 
 def list_tasks(filter_type: str = 'all') -> List[Dict[str, Any]]:
@@ -390,7 +521,10 @@ def complete_task(task_id: str) -> bool:
     Returns:
         True if completed successfully
     """
-    return get_manager().complete_task(task_id)
+    manager = get_manager()
+    ok = manager.complete_task(task_id)
+    manager.flush()
+    return ok
 
 
 def delete_task(task_id: str) -> bool:
@@ -402,7 +536,10 @@ def delete_task(task_id: str) -> bool:
     Returns:
         True if deleted successfully
     """
-    return get_manager().delete_task(task_id)
+    manager = get_manager()
+    ok = manager.delete_task(task_id)
+    manager.flush()
+    return ok
 
 
 def set_priority(task_id: str, level: int) -> bool:
@@ -415,7 +552,10 @@ def set_priority(task_id: str, level: int) -> bool:
     Returns:
         True if set successfully
     """
-    return get_manager().set_priority(task_id, level)
+    manager = get_manager()
+    ok = manager.set_priority(task_id, level)
+    manager.flush()
+    return ok
 
 
 def set_due(task_id: str, date: str) -> bool:
@@ -428,7 +568,10 @@ def set_due(task_id: str, date: str) -> bool:
     Returns:
         True if set successfully
     """
-    return get_manager().set_due(task_id, date)
+    manager = get_manager()
+    ok = manager.set_due(task_id, date)
+    manager.flush()
+    return ok
 
 
 def add_note(task_id: str, text: str) -> bool:
@@ -441,7 +584,10 @@ def add_note(task_id: str, text: str) -> bool:
     Returns:
         True if added successfully
     """
-    return get_manager().add_note(task_id, text)
+    manager = get_manager()
+    ok = manager.add_note(task_id, text)
+    manager.flush()
+    return ok
 
 
 def search_tasks(query: str) -> List[Dict[str, Any]]:
@@ -489,8 +635,8 @@ def format_task(task: Dict[str, Any], verbose: bool = False) -> str:
     # Due date
     due_str = ""
     if due and status != 'done':
-        try:
-            due_date = datetime.fromisoformat(due).date()
+        due_date = _due_date(due)
+        if due_date is not None:
             today = datetime.now().date()
             if due_date < today:
                 days_overdue = (today - due_date).days
@@ -499,7 +645,7 @@ def format_task(task: Dict[str, Any], verbose: bool = False) -> str:
                 due_str = " (DUE TODAY)"
             else:
                 due_str = f" (due {due_date})"
-        except ValueError:
+        else:
             due_str = f" (due {due})"
 
     result = f"{tid} {status_icon} {priority_str}{text}{due_str}"
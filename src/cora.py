@@ -81,6 +81,7 @@ import asyncio
 import json
 import logging
 import os
+import re
 import sys
 import shutil
 import subprocess
@@ -88,6 +89,7 @@ import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 # ============ LOGGING SETUP ============
 # Configure logging for CORA - logs to file and console
@@ -127,6 +129,60 @@ except ImportError:
     SYSTEM_TRAY_AVAILABLE = False
     logger.warning("System tray not available. Install pystray for tray icon.")
 
+# ============ OUTPUT SINK ============
+# Command output goes to a per-thread sink when one is active (GUI). The
+# first output_sink() installs a sys.stdout proxy once, so print() from any
+# module is routed per thread instead of swapping sys.stdout per command.
+_LOCAL = threading.local()
+
+
+class _Sink(list):
+    """Collects command output chunks."""
+
+    def write(self, s):
+        self.append(s)
+
+
+class _ThreadStdout:
+    """sys.stdout stand-in that sends writes to the current thread's sink, if any.
+
+    Lets print() calls here and in helper modules reach the GUI while other
+    threads keep writing to the real stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, s):
+        sink = getattr(_LOCAL, 'sink', None)
+        if sink is not None:
+            sink.write(s)
+        elif self._stream is not None:  # None under pythonw
+            self._stream.write(s)
+        return len(s)
+
+    def flush(self):
+        if getattr(_LOCAL, 'sink', None) is None and self._stream is not None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def output_sink():
+    """Capture command output on this thread. Yields the sink; ''.join(sink) is the text."""
+    if not isinstance(sys.stdout, _ThreadStdout):
+        sys.stdout = _ThreadStdout(sys.stdout)
+    sink = _Sink()
+    previous = getattr(_LOCAL, 'sink', None)
+    _LOCAL.sink = sink
+    try:
+        yield sink
+    finally:
+        _LOCAL.sink = previous
+
+
 # Global system tray instance
 _system_tray = None
 
@@ -264,31 +320,58 @@ def load_personality():
     return default_personality
 
 
+# AI greetings already generated this session: {model: greeting}. The
+# greeting prompt is SYSTEM_PROMPT, loaded once, so the model is the only input.
+_GREETING_CACHE = {}
+_FALLBACK_GREETING = "What the fuck do you want? CORA's online, bitch."
+
+
 def generate_greeting(personality):
-    """Generate an AI greeting based on full system prompt personality."""
+    """Generate an AI greeting based on full system prompt personality.
+
+    Memoized per model for the session (the fallback is never cached, so a
+    failed model call is retried); call clear_greeting_cache() after
+    settings change.
+    """
     # Try to generate via Ollama using the FULL system prompt
     if CONFIG and CONFIG.get('ollama', {}).get('enabled', True):
-        try:
-            model = CONFIG.get('ollama', {}).get('model', 'llama3.2')
+        model = CONFIG.get('ollama', {}).get('model', 'llama3.2')
+        greeting = _GREETING_CACHE.get(model)
+        if greeting is None:
+            greeting = _ai_greeting(model)
+            if greeting:
+                _GREETING_CACHE[model] = greeting
+        if greeting:
+            return greeting
+    # Fallback with CORA personality
+    return _FALLBACK_GREETING
 
-            # Use the full SYSTEM_PROMPT for proper CORA personality
-            # Extract key personality traits for the greeting prompt
-            prompt = f"""{SYSTEM_PROMPT}
+
+def _ai_greeting(model):
+    """Ask the model for a greeting; None if it fails."""
+    try:
+        # Use the full SYSTEM_PROMPT for proper CORA personality
+        # Extract key personality traits for the greeting prompt
+        prompt = f"""{SYSTEM_PROMPT}
 
 Generate a single greeting (under 15 words) that sounds like CORA - mean, sarcastic, edgy emo goth bitch energy. Use profanity naturally. Just the greeting, nothing else."""
 
-            result = subprocess.run(
-                ['ollama', 'run', model, prompt],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-        except Exception:
-            pass
-    # Fallback with CORA personality
-    return "What the fuck do you want? CORA's online, bitch."
+        result = subprocess.run(
+            ['ollama', 'run', model, prompt],
+            capture_output=True,
+            text=True,
+            timeout=15
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return None
+
+
+def clear_greeting_cache():
+    """Forget generated greetings so the next one reflects new settings."""
+    _GREETING_CACHE.clear()
 
 
 def check_ollama():
@@ -1171,8 +1254,21 @@ def cmd_search(args, tasks):
     return tasks
 
 
-def cmd_pull_model(args, tasks):
-    """Pull an Ollama model. Usage: pull <model_name>"""
+def _format_pull_progress(event):
+    """Turn an Ollama pull progress event into a short status line."""
+    status = event.get('status', '')
+    total = event.get('total')
+    if total:
+        return f"{status}: {event.get('completed', 0) * 100 // total}%"
+    return status
+
+
+def cmd_pull_model(args, tasks, progress_callback=None):
+    """Pull an Ollama model. Usage: pull <model_name>
+
+    progress_callback, if given, receives a status line whenever the pull
+    progresses; otherwise progress is shown on a single, rewritten line.
+    """
     if not args:
         print("Error: Please provide model name")
         print("Usage: pull <model_name>")
@@ -1183,22 +1279,33 @@ def cmd_pull_model(args, tasks):
     print(f"Pulling model '{model}'...")
     print("This may take a while depending on model size.")
 
+    last_line = None
+
+    def report(line):
+        if progress_callback:
+            progress_callback(line)
+        else:
+            # Rewrite one status line in place (padded over the previous text)
+            print(f"\r{line:<{len(last_line or '')}}", end='', flush=True)
+
+    def on_progress(event):
+        nonlocal last_line
+        line = _format_pull_progress(event)
+        # Only report when the line changes (status or whole percent)
+        if line and line != last_line:
+            report(line)
+            last_line = line
+
     try:
-        result = subprocess.run(
-            ['ollama', 'pull', model],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
+        from cora_tools.ai_tools import pull_model
+        pulled = pull_model(model, progress_callback=on_progress)
+        if last_line is not None and not progress_callback:
+            print()  # End the progress line
+        if pulled:
             print(f"Model '{model}' pulled successfully!")
-            print(result.stdout)
         else:
-            logger.error(f"Error pulling model: {result.stderr}")
-            print(f"Error pulling model: {result.stderr}")
-    except FileNotFoundError:
-        logger.error("Ollama not found")
-        print("Error: Ollama not found. Please install Ollama first.")
-        print("Visit: https://ollama.ai")
+            logger.error(f"Error pulling model: {model}")
+            print(f"Error pulling model '{model}'. Is Ollama running? (ollama serve)")
     except Exception as e:
         logger.error(f"Pull model error: {e}")
         print(f"Error: {e}")
@@ -1546,24 +1653,39 @@ def get_task_context(tasks):
     if not tasks:
         return "The user has no tasks currently."
 
-    pending = [t for t in tasks if t['status'] == 'pending']
-    active = [t for t in tasks if t['status'] == 'active']
-    done = [t for t in tasks if t['status'] == 'done']
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    # Single pass: status buckets, high priority pending and overdue
+    pending = []
+    high_pri = []
+    overdue = []
+    active = done = 0
+    for t in tasks:
+        status = t['status']
+        if status == 'pending':
+            pending.append(t)
+            if t.get('priority', 5) <= 3:
+                high_pri.append(t)
+        elif status == 'active':
+            active += 1
+        elif status == 'done':
+            done += 1
+            continue
+        due = t.get('due')
+        if due and due < today:
+            overdue.append(t)
 
     context_parts = [
-        f"The user has {len(tasks)} total tasks: {len(pending)} pending, {len(active)} active, {len(done)} done."
+        f"The user has {len(tasks)} total tasks: {len(pending)} pending, {active} active, {done} done."
     ]
 
     # Add high priority pending tasks
-    high_pri = [t for t in pending if t.get('priority', 5) <= 3]
     if high_pri:
         context_parts.append("High priority pending tasks:")
         for t in high_pri[:3]:
             context_parts.append(f"  - {t['id']}: {t['text']} (P{t.get('priority', 5)})")
 
     # Add overdue tasks
-    today = datetime.now().strftime('%Y-%m-%d')
-    overdue = [t for t in tasks if t.get('due') and t['due'] < today and t['status'] != 'done']
     if overdue:
         context_parts.append("Overdue tasks:")
         for t in overdue[:3]:
@@ -1621,6 +1743,15 @@ def fallback_response(user_message, tasks):
     return "I'm in offline mode (Ollama unavailable). I can still help with basic task queries. Try asking about your tasks, priorities, or due dates!"
 
 
+def build_chat_system_prompt(tasks):
+    """Load CORA's full system prompt and append the current task context."""
+    system_prompt = get_system_prompt()
+    task_context = get_task_context(tasks)
+    if task_context:
+        system_prompt += f"\n\nCurrent Task Context:\n{task_context}"
+    return system_prompt
+
+
 def cmd_chat(args, tasks):
     """Chat with AI using Ollama with task context and conversation memory. Usage: chat <message>
 
@@ -1642,13 +1773,8 @@ def cmd_chat(args, tasks):
     load_chat_history()
 
     # Build context-aware prompt with conversation memory
-    task_context = get_task_context(tasks)
     chat_history = get_chat_history_context()
-
-    # Load CORA's full system prompt and add task context
-    system_prompt = get_system_prompt()
-    if task_context:
-        system_prompt += f"\n\nCurrent Task Context:\n{task_context}"
+    system_prompt = build_chat_system_prompt(tasks)
 
     # Include conversation history if available (for subprocess fallback)
     if chat_history:
@@ -1719,6 +1845,52 @@ def cmd_chat(args, tasks):
     return tasks
 
 
+def stream_chat(args, tasks, on_chunk):
+    """Chat with AI, delivering the reply to on_chunk as tokens arrive.
+
+    Same context and history handling as cmd_chat, but the caller sees the
+    first token instead of waiting for the full completion. Falls back to
+    cmd_chat when the streaming API is unavailable.
+    """
+    global CONFIG
+    if CONFIG is None:
+        load_config()
+
+    if not args:
+        on_chunk("Please provide a message. Usage: chat <your message>")
+        return tasks
+
+    try:
+        from ai.ollama import chat_stream as ollama_chat_stream
+    except ImportError:
+        return cmd_chat(args, tasks)
+
+    user_message = ' '.join(args)
+    model = CONFIG.get('ollama', {}).get('model', 'llama3.2')
+    load_chat_history()
+    system_prompt = build_chat_system_prompt(tasks)
+
+    parts = []
+    messages = [{'role': 'user', 'content': user_message}]
+    for chunk in ollama_chat_stream(messages, model=model, system=system_prompt, timeout=60):
+        if not parts and chunk.startswith('[Error'):
+            # Nothing streamed yet - answer offline instead
+            response = fallback_response(user_message, tasks)
+            on_chunk(response)
+            on_chunk(f"\n({chunk[1:-1]})")
+            parts = [response]
+            break
+        parts.append(chunk)
+        on_chunk(chunk)
+
+    response = ''.join(parts)
+    if response:
+        add_to_chat_history('user', user_message)
+        add_to_chat_history('assistant', response)
+
+    return tasks
+
+
 def cmd_chathistory(args, tasks):
     """View or clear chat history. Usage: chathistory [clear]"""
     global CHAT_HISTORY
@@ -1834,6 +2006,9 @@ def cmd_settings(args, tasks):
     with open(CONFIG_FILE, 'w') as f:
         json.dump(CONFIG, f, indent=2)
 
+    # Greeting depends on the model setting
+    clear_greeting_cache()
+
     print(f"Updated: {key} = {value}")
     return tasks
 
@@ -1844,24 +2019,28 @@ def cmd_stats(args, tasks):
         respond('info', {'message': "No tasks found. Use 'add <text>' to create one."})
         return tasks
 
-    # Count by status
-    pending = len([t for t in tasks if t['status'] == 'pending'])
-    active = len([t for t in tasks if t['status'] == 'active'])
-    done = len([t for t in tasks if t['status'] == 'done'])
+    today = datetime.now().strftime('%Y-%m-%d')
     total = len(tasks)
 
-    # Count by priority
+    # Single pass: status, priority, overdue and notes counts
+    pending = active = done = overdue = with_notes = 0
     pri_counts = {}
+    pri_get = pri_counts.get
     for t in tasks:
-        p = t.get('priority', 5)
-        pri_counts[p] = pri_counts.get(p, 0) + 1
-
-    # Count overdue
-    today = datetime.now().strftime('%Y-%m-%d')
-    overdue = len([t for t in tasks if t.get('due') and t['due'] < today and t['status'] != 'done'])
-
-    # Count with notes
-    with_notes = len([t for t in tasks if t.get('notes')])
+        status = t['status']
+        due = t.get('due')
+        prio = t.get('priority', 5)
+        if status == 'pending':
+            pending += 1
+        elif status == 'active':
+            active += 1
+        elif status == 'done':
+            done += 1
+        pri_counts[prio] = pri_get(prio, 0) + 1
+        if due and due < today and status != 'done':
+            overdue += 1
+        if t.get('notes'):
+            with_notes += 1
 
     print("\n=== TASK STATISTICS ===")
     print("-" * 40)
@@ -2001,11 +2180,20 @@ def cmd_clear(args, tasks):
 
 def cmd_today(args, tasks):
     """Show tasks due today and overdue tasks."""
-    today = datetime.now().strftime('%Y-%m-%d')
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
 
-    # Find overdue and today's tasks
-    overdue = [t for t in tasks if t.get('due') and t['due'] < today and t['status'] != 'done']
-    today_tasks = [t for t in tasks if t.get('due') == today and t['status'] != 'done']
+    # Find overdue and today's tasks in one pass
+    overdue = []
+    today_tasks = []
+    for t in tasks:
+        due = t.get('due')
+        if not due or t['status'] == 'done':
+            continue
+        if due < today:
+            overdue.append(t)
+        elif due == today:
+            today_tasks.append(t)
 
     if not overdue and not today_tasks:
         print("No tasks due today or overdue.")
@@ -2017,7 +2205,7 @@ def cmd_today(args, tasks):
         print(f"\nOVERDUE ({len(overdue)}):")
         print("-" * 50)
         for task in overdue:
-            days_late = (datetime.now() - datetime.strptime(task['due'], '%Y-%m-%d')).days
+            days_late = (now - datetime.strptime(task['due'], '%Y-%m-%d')).days
             print(f"  {task['id']}: {task['text'][:35]} (due {task['due']}, {days_late}d late)")
 
     if today_tasks:
@@ -2464,6 +2652,42 @@ def cmd_open_cli(args, tasks):
     return tasks
 
 
+# Natural language patterns -> command mappings, compiled once at import
+_NL_PATTERNS = [
+    # Web search patterns
+    (re.compile(r'^(?:web\s*)?search\s+(?:for\s+)?(.+)$'), 'search'),
+    (re.compile(r'^look\s+up\s+(.+)$'), 'search'),
+    (re.compile(r'^google\s+(.+)$'), 'search'),
+    (re.compile(r'^find\s+(?:info\s+(?:on|about)\s+)?(.+)$'), 'search'),
+
+    # CLI/terminal patterns
+    (re.compile(r'^open\s+(?:the\s+)?(?:cli|terminal|shell|command\s*(?:line|prompt)?)$'), 'cli'),
+    (re.compile(r'^(?:run|execute|start)\s+(?:the\s+)?(?:cli|terminal|shell)$'), 'cli'),
+
+    # Calculator patterns
+    (re.compile(r'^(?:calculate|calc|compute)\s+(.+)$'), 'calc'),
+    (re.compile(r'^what\s+is\s+(\d+[\s\d\+\-\*\/\.\(\)]+)$'), 'calc'),
+    (re.compile(r'^(\d+[\s\d\+\-\*\/\.\(\)]+)=?\s*$'), 'calc'),
+
+    # Vision/camera patterns
+    (re.compile(r'^(?:take\s+a\s+)?(?:look|see|show\s+me)(?:\s+(?:at|around))?(?:\s+(.*))?$'), 'see'),
+    (re.compile(r'^what\s+(?:do\s+you\s+see|can\s+you\s+see|is\s+(?:in\s+front\s+of\s+you|around))(.*)$'), 'see'),
+
+    # Image generation patterns
+    (re.compile(r'^(?:generate|create|make|draw)\s+(?:an?\s+)?(?:image|picture|photo)\s+(?:of\s+)?(.+)$'), 'imagine'),
+
+    # Task patterns
+    (re.compile(r'^(?:add|create)\s+(?:a\s+)?(?:task|todo|reminder)[:;]?\s+(.+)$'), 'add'),
+    (re.compile(r'^(?:show|list|display)\s+(?:my\s+)?(?:tasks?|todos?|list)$'), 'list'),
+
+    # Speech patterns
+    (re.compile(r'^(?:say|speak|tell\s+me)\s+(.+)$'), 'speak'),
+
+    # Help patterns
+    (re.compile(r'^(?:help|commands|what\s+can\s+you\s+do).*$'), 'help'),
+]
+
+
 def parse_input(user_input):
     """Parse user input into command and arguments with natural language support.
 
@@ -2482,44 +2706,8 @@ def parse_input(user_input):
     if not text:
         return None, []
 
-    # Natural language patterns -> command mappings
-    nl_patterns = [
-        # Web search patterns
-        (r'^(?:web\s*)?search\s+(?:for\s+)?(.+)$', 'search'),
-        (r'^look\s+up\s+(.+)$', 'search'),
-        (r'^google\s+(.+)$', 'search'),
-        (r'^find\s+(?:info\s+(?:on|about)\s+)?(.+)$', 'search'),
-
-        # CLI/terminal patterns
-        (r'^open\s+(?:the\s+)?(?:cli|terminal|shell|command\s*(?:line|prompt)?)$', 'cli'),
-        (r'^(?:run|execute|start)\s+(?:the\s+)?(?:cli|terminal|shell)$', 'cli'),
-
-        # Calculator patterns
-        (r'^(?:calculate|calc|compute)\s+(.+)$', 'calc'),
-        (r'^what\s+is\s+(\d+[\s\d\+\-\*\/\.\(\)]+)$', 'calc'),
-        (r'^(\d+[\s\d\+\-\*\/\.\(\)]+)=?\s*$', 'calc'),
-
-        # Vision/camera patterns
-        (r'^(?:take\s+a\s+)?(?:look|see|show\s+me)(?:\s+(?:at|around))?(?:\s+(.*))?$', 'see'),
-        (r'^what\s+(?:do\s+you\s+see|can\s+you\s+see|is\s+(?:in\s+front\s+of\s+you|around))(.*)$', 'see'),
-
-        # Image generation patterns
-        (r'^(?:generate|create|make|draw)\s+(?:an?\s+)?(?:image|picture|photo)\s+(?:of\s+)?(.+)$', 'imagine'),
-
-        # Task patterns
-        (r'^(?:add|create)\s+(?:a\s+)?(?:task|todo|reminder)[:;]?\s+(.+)$', 'add'),
-        (r'^(?:show|list|display)\s+(?:my\s+)?(?:tasks?|todos?|list)$', 'list'),
-
-        # Speech patterns
-        (r'^(?:say|speak|tell\s+me)\s+(.+)$', 'speak'),
-
-        # Help patterns
-        (r'^(?:help|commands|what\s+can\s+you\s+do).*$', 'help'),
-    ]
-
-    import re
-    for pattern, cmd in nl_patterns:
-        match = re.match(pattern, text)
+    for pattern, cmd in _NL_PATTERNS:
+        match = pattern.match(text)
         if match:
             # Extract captured group as args if present
             if match.groups() and match.group(1):
@@ -2535,6 +2723,100 @@ def parse_input(user_input):
     return parts[0].lower(), parts[1:]
 
 
+# Command aliases, normalized to canonical names before dispatch
+_ALIASES = {
+    'ls': 'list',
+    'complete': 'done',
+    'del': 'delete',
+    'remove': 'delete',
+    'rm': 'delete',
+    'priority': 'pri',
+    'deadline': 'due',
+    'view': 'show',
+    'find': 'search',
+    'knowledge': 'recall',
+    'kb': 'recall',
+    'mem': 'remember',
+    'count': 'stats',
+    'ai': 'chat',
+    'history': 'chathistory',
+    'say': 'speak',
+    'modify': 'edit',
+    'config': 'settings',
+    '?': 'help',
+    'version': 'about',
+    'cls': 'clear',
+    'reminder': 'remind',
+    'launch': 'open',
+    'run': 'open',
+    'newtool': 'create_tool',
+    'edittool': 'modify_tool',
+    'tools': 'list_tools',
+    'look': 'see',
+    'vision': 'see',
+    'camera': 'see',
+    'generate': 'imagine',
+    'draw': 'imagine',
+    'create': 'imagine',
+    'terminal': 'cli',
+    'popup': 'cli',
+}
+
+
+def resolve_command(cmd):
+    """Map a command alias to its canonical name."""
+    return _ALIASES.get(cmd, cmd)
+
+
+# Interactive command dispatch table (canonical names only), built at import time
+_CLI_COMMANDS = {
+    'add': cmd_add,
+    'list': cmd_list,
+    'done': cmd_done,
+    'delete': cmd_delete,
+    'pri': cmd_pri,
+    'due': cmd_due,
+    'note': cmd_note,
+    'status': cmd_status,
+    'show': cmd_show,
+    'search': cmd_search,
+    'learn': cmd_learn,
+    'recall': cmd_recall,
+    'remember': cmd_remember,
+    'stats': cmd_stats,
+    'pull': cmd_pull_model,
+    'chat': cmd_chat,
+    'chathistory': cmd_chathistory,
+    'speak': cmd_speak,
+    'backup': cmd_backup,
+    'edit': cmd_edit,
+    'settings': cmd_settings,
+    'help': cmd_help,
+    'about': cmd_about,
+    'clear': cmd_clear,
+    'today': cmd_today,
+    'undo': cmd_undo,
+    'remind': cmd_remind,
+    'open': cmd_open,
+    'create_tool': cmd_create_tool,
+    'modify_tool': cmd_modify_tool,
+    'list_tools': cmd_list_tools,
+    'see': cmd_see,
+    'imagine': cmd_imagine,
+    'cli': cmd_open_cli,
+}
+
+
+def _dispatch(cmd, args, tasks):
+    """Run one command through _CLI_COMMANDS; unknown commands show help."""
+    handler = _CLI_COMMANDS.get(resolve_command(cmd))
+    if handler is None:
+        logger.debug(f"Unknown command attempted: {cmd}")
+        print(f"Unknown command: {cmd}")
+        return cmd_help([], tasks)
+    return handler(args, tasks)
+
+
 def main():
     """Main entry point with command loop."""
     global _system_tray
@@ -2597,78 +2879,8 @@ def main():
     # Load existing tasks
     tasks = load_tasks()
 
-    # Command dispatch table
-    commands = {
-        'add': cmd_add,
-        'list': cmd_list,
-        'ls': cmd_list,
-        'done': cmd_done,
-        'complete': cmd_done,
-        'delete': cmd_delete,
-        'del': cmd_delete,
-        'remove': cmd_delete,
-        'rm': cmd_delete,
-        'pri': cmd_pri,
-        'priority': cmd_pri,
-        'due': cmd_due,
-        'deadline': cmd_due,
-        'note': cmd_note,
-        'status': cmd_status,
-        'show': cmd_show,
-        'view': cmd_show,
-        'search': cmd_search,
-        'find': cmd_search,
-        'learn': cmd_learn,
-        'recall': cmd_recall,
-        'knowledge': cmd_recall,
-        'kb': cmd_recall,
-        'remember': cmd_remember,
-        'mem': cmd_remember,
-        'stats': cmd_stats,
-        'count': cmd_stats,
-        'pull': cmd_pull_model,
-        'chat': cmd_chat,
-        'ai': cmd_chat,
-        'chathistory': cmd_chathistory,
-        'history': cmd_chathistory,
-        'speak': cmd_speak,
-        'say': cmd_speak,
-        'backup': cmd_backup,
-        'edit': cmd_edit,
-        'modify': cmd_edit,
-        'settings': cmd_settings,
-        'config': cmd_settings,
-        'help': cmd_help,
-        '?': cmd_help,
-        'about': cmd_about,
-        'version': cmd_about,
-        'clear': cmd_clear,
-        'cls': cmd_clear,
-        'today': cmd_today,
-        'undo': cmd_undo,
-        'remind': cmd_remind,
-        'reminder': cmd_remind,
-        'open': cmd_open,
-        'launch': cmd_open,
-        'run': cmd_open,
-        'create_tool': cmd_create_tool,
-        'newtool': cmd_create_tool,
-        'modify_tool': cmd_modify_tool,
-        'edittool': cmd_modify_tool,
-        'list_tools': cmd_list_tools,
-        'tools': cmd_list_tools,
-        'see': cmd_see,
-        'look': cmd_see,
-        'vision': cmd_see,
-        'camera': cmd_see,
-        'imagine': cmd_imagine,
-        'generate': cmd_imagine,
-        'draw': cmd_imagine,
-        'create': cmd_imagine,
-        'cli': cmd_open_cli,
-        'terminal': cmd_open_cli,
-        'popup': cmd_open_cli,
-    }
+    # Command dispatch table (built once at import time)
+    commands = _CLI_COMMANDS
 
     # Main loop
     while True:
@@ -2689,8 +2901,9 @@ def main():
                 break
 
             # Execute command
-            if cmd in commands:
-                tasks = commands[cmd](args, tasks)
+            handler = commands.get(resolve_command(cmd))
+            if handler:
+                tasks = handler(args, tasks)
             else:
                 respond('unknown_command', {'cmd': cmd})
 
@@ -2716,52 +2929,7 @@ if __name__ == "__main__":
         cmd = sys.argv[1].lower()
         args = sys.argv[2:]
 
-        commands = {
-            'add': cmd_add,
-            'list': cmd_list,
-            'done': cmd_done,
-            'delete': cmd_delete,
-            'pri': cmd_pri,
-            'due': cmd_due,
-            'note': cmd_note,
-            'status': cmd_status,
-            'show': cmd_show,
-            'search': cmd_search,
-            'learn': cmd_learn,
-            'recall': cmd_recall,
-            'remember': cmd_remember,
-            'mem': cmd_remember,
-            'stats': cmd_stats,
-            'pull': cmd_pull_model,
-            'chat': cmd_chat,
-            'chathistory': cmd_chathistory,
-            'speak': cmd_speak,
-            'backup': cmd_backup,
-            'edit': cmd_edit,
-            'settings': cmd_settings,
-            'help': cmd_help,
-            'about': cmd_about,
-            'version': cmd_about,
-            'create_tool': cmd_create_tool,
-            'modify_tool': cmd_modify_tool,
-            'list_tools': cmd_list_tools,
-            'tools': cmd_list_tools,
-            'see': cmd_see,
-            'look': cmd_see,
-            'vision': cmd_see,
-            'camera': cmd_see,
-            'imagine': cmd_imagine,
-            'generate': cmd_imagine,
-            'draw': cmd_imagine,
-            'create': cmd_imagine,
-        }
-
-        if cmd in commands:
-            commands[cmd](args, tasks)
-        else:
-            logger.debug(f"Unknown command attempted: {cmd}")
-            print(f"Unknown command: {cmd}")
-            cmd_help([], tasks)
+        _dispatch(cmd, args, tasks)
     else:
         # Interactive mode
         main()
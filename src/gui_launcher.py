@@ -16,16 +16,19 @@ Usage:
 
 import sys
 import os
-import io
 import argparse
+import functools
+import queue
 import threading
 from pathlib import Path
-from contextlib import redirect_stdout
 
-# Add project root to path - gui_launcher.py is in src/, so go up one level
+# Project root (for ui/services) and src/ (for cora) must be importable.
+# src/ is already sys.path[0] when launched as `python src/gui_launcher.py`,
+# so only add entries that are missing instead of growing sys.path.
 PROJECT_DIR = Path(os.path.dirname(os.path.abspath(__file__))).parent
-sys.path.insert(0, str(PROJECT_DIR))
-sys.path.insert(0, str(PROJECT_DIR / 'src'))  # Also add src/ for cora module
+for _path in (str(PROJECT_DIR), str(PROJECT_DIR / 'src')):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Import cora.py functions
 import cora
@@ -51,9 +54,27 @@ except ImportError:
 class CoraGUIApp(CoraApp):
     """Extended GUI that integrates with cora.py commands."""
 
+    # Commands that close the window instead of dispatching
+    _EXIT_CMDS = frozenset(('exit', 'quit', 'q'))
+
+    # Slow commands that only read the task list; they run on a snapshot
+    # without holding _tasks_lock, so they don't hold up task edits
+    _UNLOCKED_CMDS = frozenset(('pull', 'imagine', 'see'))
+
+    # UI queue drain interval and per-tick cap
+    _UI_DRAIN_MS = 50
+    _UI_DRAIN_MAX = 200
+
     def __init__(self, boot_summary=None):
         super().__init__()
 
+        # Commands run on the worker threads and mutate self.tasks in place
+        self._tasks_lock = threading.Lock()
+
+        # UI updates from worker threads, applied in batches on the Tk thread
+        self._ui_q = queue.Queue()
+        self.after(self._UI_DRAIN_MS, self._drain_ui)
+
         # Load tasks from cora.py
         cora.load_config()
         self.tasks = cora.load_tasks()
@@ -116,105 +137,134 @@ class CoraGUIApp(CoraApp):
         self.chat_display.insert("end", f"[CORA]: {greeting}\n\n")
         self.chat_display.configure(state="disabled")
 
+    def _ui(self, fn, *args):
+        """Queue a UI update from any thread; it runs on the next drain tick."""
+        self._ui_q.put((fn, args))
+
+    def _apply_ui(self, fn, args):
+        """Run one queued UI update; a failure is reported instead of ending the drain loop."""
+        try:
+            fn(*args)
+        except Exception as e:
+            print(f"[!] UI update failed: {e}")
+
+    def _drain_ui(self):
+        """Apply queued UI updates, coalescing stream chunks and status changes."""
+        items = []
+        try:
+            while len(items) < self._UI_DRAIN_MAX:
+                items.append(self._ui_q.get_nowait())
+        except queue.Empty:
+            pass
+
+        pending_chunks = []
+        for i, (fn, args) in enumerate(items):
+            # Merge consecutive stream chunks into one insert
+            if fn == self._append_stream_chunk:
+                pending_chunks.append(args[0])
+                continue
+            if pending_chunks:
+                self._apply_ui(self._append_stream_chunk, (''.join(pending_chunks),))
+                pending_chunks = []
+            # Only the last of consecutive status updates is visible anyway
+            if fn == self._set_status and i + 1 < len(items) and items[i + 1][0] == self._set_status:
+                continue
+            self._apply_ui(fn, args)
+            if fn == self._on_closing:
+                return  # Window is gone; stop draining
+        if pending_chunks:
+            self._apply_ui(self._append_stream_chunk, (''.join(pending_chunks),))
+
+        self.after(self._UI_DRAIN_MS, self._drain_ui)
+
+    def _begin_stream_message(self):
+        """Open a new CORA message that streamed chunks are appended to."""
+        self.chat_display.configure(state="normal")
+        self.chat_display.insert("end", "[CORA]: ")
+        self.chat_display.configure(state="disabled")
+
+    def _append_stream_chunk(self, chunk):
+        """Append a streamed chunk to the current CORA message."""
+        self.chat_display.configure(state="normal")
+        self.chat_display.insert("end", chunk)
+        self.chat_display.configure(state="disabled")
+        self.chat_display.see("end")
+
+    def _stream_chat(self, args):
+        """Run a chat command, pushing reply chunks to the display as they arrive."""
+        self._ui(self._begin_stream_message)
+
+        def on_chunk(chunk):
+            self._ui(self._append_stream_chunk, chunk)
+
+        # Anything printed (e.g. the non-streaming fallback) is shown afterwards
+        with cora.output_sink() as output:
+            try:
+                with self._tasks_lock:
+                    tasks = list(self.tasks)
+                cora.stream_chat(args, tasks, on_chunk)
+            except Exception as e:
+                output.write(f"[Error]: {e}\n")
+
+        printed = ''.join(output).strip()
+        if printed:
+            on_chunk(printed)
+
+        self._ui(self._append_stream_chunk, "\n\n")
+        self._ui(self._set_status, "Ready")
+
     def _process_command(self, message):
         """Process a command using cora.py backend."""
         cmd, args = cora.parse_input(message)
 
         if not cmd:
-            self.after(0, lambda: self._set_status("Ready"))
+            self._ui(self._set_status, "Ready")
             return
 
         # Check for exit commands
-        if cmd in ('exit', 'quit', 'q'):
-            self.after(0, self._on_closing)
+        if cmd in self._EXIT_CMDS:
+            self._ui(self._on_closing)
             return
 
-        # Build command dispatch table (same as cora.py main())
-        commands = {
-            'add': cora.cmd_add,
-            'list': cora.cmd_list,
-            'ls': cora.cmd_list,
-            'done': cora.cmd_done,
-            'complete': cora.cmd_done,
-            'delete': cora.cmd_delete,
-            'del': cora.cmd_delete,
-            'remove': cora.cmd_delete,
-            'rm': cora.cmd_delete,
-            'pri': cora.cmd_pri,
-            'priority': cora.cmd_pri,
-            'due': cora.cmd_due,
-            'deadline': cora.cmd_due,
-            'note': cora.cmd_note,
-            'status': cora.cmd_status,
-            'show': cora.cmd_show,
-            'view': cora.cmd_show,
-            'search': cora.cmd_search,
-            'find': cora.cmd_search,
-            'learn': cora.cmd_learn,
-            'recall': cora.cmd_recall,
-            'knowledge': cora.cmd_recall,
-            'kb': cora.cmd_recall,
-            'stats': cora.cmd_stats,
-            'count': cora.cmd_stats,
-            'pull': cora.cmd_pull_model,
-            'chat': cora.cmd_chat,
-            'ai': cora.cmd_chat,
-            'chathistory': cora.cmd_chathistory,
-            'history': cora.cmd_chathistory,
-            'speak': cora.cmd_speak,
-            'say': cora.cmd_speak,
-            'backup': cora.cmd_backup,
-            'edit': cora.cmd_edit,
-            'modify': cora.cmd_edit,
-            'settings': cora.cmd_settings,
-            'config': cora.cmd_settings,
-            'help': cora.cmd_help,
-            '?': cora.cmd_help,
-            'today': cora.cmd_today,
-            'undo': cora.cmd_undo,
-            'remind': cora.cmd_remind,
-            'reminder': cora.cmd_remind,
-            'open': cora.cmd_open,
-            'launch': cora.cmd_open,
-            'run': cora.cmd_open,
-            'create_tool': cora.cmd_create_tool,
-            'newtool': cora.cmd_create_tool,
-            'modify_tool': cora.cmd_modify_tool,
-            'edittool': cora.cmd_modify_tool,
-            'list_tools': cora.cmd_list_tools,
-            'tools': cora.cmd_list_tools,
-            'see': cora.cmd_see,
-            'look': cora.cmd_see,
-            'vision': cora.cmd_see,
-            'camera': cora.cmd_see,
-            'imagine': cora.cmd_imagine,
-            'generate': cora.cmd_imagine,
-            'draw': cora.cmd_imagine,
-            'create': cora.cmd_imagine,
-            'cli': cora.cmd_open_cli,
-            'terminal': cora.cmd_open_cli,
-            'popup': cora.cmd_open_cli,
-        }
-
-        # Capture stdout to display in chat
-        output = io.StringIO()
-
-        if cmd in commands:
-            try:
-                with redirect_stdout(output):
-                    self.tasks = commands[cmd](args, self.tasks)
-            except Exception as e:
-                output.write(f"[Error]: {e}\n")
-        else:
-            output.write(f"[CORA]: Unknown command: {cmd}. Type 'help' for available commands.\n")
+        # Same table as the CLI, so both accept the same commands and aliases
+        name = cora.resolve_command(cmd)
+
+        # Stream chat replies so the first tokens show up immediately
+        if name == 'chat':
+            self._stream_chat(args)
+            return
 
-        # Get captured output
-        response = output.getvalue().strip()
+        handler = cora._CLI_COMMANDS.get(name)
+
+        # Pull progress updates the status bar while it runs
+        if name == 'pull':
+            def on_progress(line):
+                self._ui(self._set_status, line)
+            handler = functools.partial(handler, progress_callback=on_progress)
+
+        # Collect command output to display in chat
+        with cora.output_sink() as output:
+            if handler:
+                try:
+                    if name in self._UNLOCKED_CMDS:
+                        with self._tasks_lock:
+                            tasks = list(self.tasks)
+                        handler(args, tasks)
+                    else:
+                        # Handlers edit the list in place and save it
+                        with self._tasks_lock:
+                            self.tasks = handler(args, self.tasks)
+                except Exception as e:
+                    output.write(f"[Error]: {e}\n")
+            else:
+                output.write(f"[CORA]: Unknown command: {cmd}. Type 'help' for available commands.\n")
+
+        response = ''.join(output).strip()
         if response:
             # Update UI from main thread
-            self.after(0, lambda: self._add_message("CORA", response))
+            self._ui(self._add_message, "CORA", response)
 
-        self.after(0, lambda: self._set_status("Ready"))
+        self._ui(self._set_status, "Ready")
 
 
 def main():
@@ -13,6 +13,7 @@ import sys
 import json
 from pathlib import Path
 from io import StringIO
+import queue
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -99,6 +100,13 @@ class CoraApp(ctk.CTk):
         # GUI ready flag - prevents TTS race condition during boot
         self.gui_ready = False
 
+        # Command workers so the Tk mainloop never blocks on them. Daemon
+        # threads, so a long pull or imagine can't keep the process alive
+        # after the window closes
+        self._cmd_q = queue.Queue()
+        for i in range(2):
+            threading.Thread(target=self._command_worker, name=f'cora-cmd-{i}', daemon=True).start()
+
         # Window setup
         self.title("C.O.R.A - Cognitive Operations & Reasoning Assistant")
         self.geometry("900x600")
@@ -328,6 +336,15 @@ class CoraApp(ctk.CTk):
         self.chat_display.configure(state="disabled")
         self.chat_display.see("end")
 
+    def _command_worker(self):
+        """Run queued messages through _process_command, one at a time."""
+        while True:
+            message = self._cmd_q.get()
+            try:
+                self._process_command(message)
+            except Exception as e:
+                print(f"[!] Command failed: {e}")
+
     def _send_message(self):
         """Handle sending a message."""
         message = self.input_entry.get().strip()
@@ -337,13 +354,9 @@ class CoraApp(ctk.CTk):
         self._add_message("You", message)
         self.input_entry.delete(0, "end")
 
-        # Process command in background thread (ASYNC pattern)
+        # Process command on the worker pool (ASYNC pattern)
         self._set_status("Processing...")
-        threading.Thread(
-            target=self._process_command,
-            args=(message,),
-            daemon=True
-        ).start()
+        self._cmd_q.put(message)
 
     def _process_command(self, message):
         """Process a command (runs in background thread).